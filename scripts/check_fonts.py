@@ -5,45 +5,67 @@
 Проверяет наличие файлов формата .ttf (TrueType Font).
 """
 
+import argparse
 import os
 import shutil
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 
 # Расширение TTF файлов
 TTF_EXTENSION = '.ttf'
 ASSETS_FONTS_DIR = Path('assets') / 'fonts'
 LEGACY_FONTS_DIR = Path('fonts')
+# Размер буфера копирования (1 MiB вместо стандартных 64 KiB)
+COPY_BUFFER_SIZE = 1024 * 1024
 
+# На Windows shutil.copy2 использует CopyFile2 и буфер не нужен;
+# на остальных платформах увеличиваем буфер для копирования TTF.
+if os.name != 'nt':
+    shutil.COPY_BUFSIZE = COPY_BUFFER_SIZE
 
-def find_ttf_files(directory: Path) -> List[Path]:
+
+def find_ttf_files(directory: Path, max_depth: Optional[int] = None) -> List[Path]:
     """
     Рекурсивно находит все TTF файлы в указанной директории.
     
     Args:
         directory: Путь к директории для поиска
+        max_depth: Максимальная глубина спуска в подкаталоги
+            (0 — только сама директория, None — без ограничений)
         
     Returns:
         Список путей к найденным TTF файлам
     """
     ttf_files = []
+    stack = [(str(directory), 0)]
     
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix.lower() == TTF_EXTENSION:
-                ttf_files.append(file_path)
+    # Обходим дерево через os.scandir без рекурсии: тип записи берётся из DirEntry
+    # без лишних stat-вызовов, а Path создаётся только для найденных TTF.
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if max_depth is None or depth < max_depth:
+                            stack.append((entry.path, depth + 1))
+                    elif entry.name.lower().endswith(TTF_EXTENSION):
+                        ttf_files.append(Path(entry.path))
+        except OSError:
+            # Как и os.walk: недоступные или исчезнувшие каталоги пропускаем
+            continue
     
     return ttf_files
 
 
-def check_iconpack_fonts(iconpack_dir: Path) -> Dict[str, any]:
+def check_iconpack_fonts(iconpack_dir: Path, max_depth: Optional[int] = None) -> Dict[str, any]:
     """
     Проверяет наличие TTF файлов шрифтов в папке иконпака.
     
     Args:
         iconpack_dir: Путь к папке иконпака
+        max_depth: Максимальная глубина поиска (None — без ограничений)
         
     Returns:
         Словарь с результатами проверки:
@@ -51,7 +73,7 @@ def check_iconpack_fonts(iconpack_dir: Path) -> Dict[str, any]:
         - ttf_files: List[Path] - список найденных TTF файлов
         - ttf_count: int - количество TTF файлов
     """
-    ttf_files = find_ttf_files(iconpack_dir)
+    ttf_files = find_ttf_files(iconpack_dir, max_depth)
     
     return {
         'has_ttf': len(ttf_files) > 0,
@@ -109,6 +131,17 @@ def copy_ttf_to_fonts(
 
 def main():
     """Основная функция скрипта."""
+    parser = argparse.ArgumentParser(description="Поиск TTF файлов в иконпаках и копирование в fonts")
+    parser.add_argument(
+        '--max-depth',
+        type=int,
+        default=None,
+        help="Максимальная глубина поиска TTF внутри папки иконпака (по умолчанию без ограничений)",
+    )
+    args = parser.parse_args()
+    if args.max_depth is not None and args.max_depth < 0:
+        parser.error("--max-depth должно быть не меньше 0")
+    
     # Путь к папке с иконпаками
     tp_dir = Path('tp')
     fonts_dir, is_legacy_layout = resolve_fonts_dir()
@@ -126,13 +159,17 @@ def main():
     results = {}
     copied_files = []
     
-    # Проходим по всем папкам в tp/
-    for iconpack_path in sorted(tp_dir.iterdir()):
-        if not iconpack_path.is_dir():
-            continue
-        
-        iconpack_name = iconpack_path.name
-        result = check_iconpack_fonts(iconpack_path)
+    # Проходим по всем папкам в tp/ (тип записи берём из DirEntry)
+    with os.scandir(tp_dir) as it:
+        iconpack_entries = sorted(
+            (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.name,
+        )
+    
+    for entry in iconpack_entries:
+        iconpack_path = Path(entry.path)
+        iconpack_name = entry.name
+        result = check_iconpack_fonts(iconpack_path, args.max_depth)
         results[iconpack_name] = result
         
         # Выводим результат
@@ -11,145 +11,393 @@ Bezier/Cubic Bezier и Arc (дуги аппроксимируются кубик
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
+import re
 import sys
-import xml.etree.ElementTree as ET
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
 
-from fontTools.fontBuilder import FontBuilder
-from fontTools.pens.cu2quPen import Cu2QuPen
-from fontTools.pens.ttGlyphPen import TTGlyphPen
-from fontTools.pens.transformPen import TransformPen
-from fontTools.ttLib import newTable
-from svgpathtools import Arc, CubicBezier, Line, Path as SvgPath, QuadraticBezier, parse_path
+# fontTools, svgpathtools, lxml и пул процессов импортируются лениво внутри
+# функций: так `--help` отвечает сразу, а рабочие процессы пула не платят
+# за лишние импорты.
+if TYPE_CHECKING:
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+    from fontTools.pens.transformPen import TransformPen
 
 
-def _parse_svg_font(svg_path: Path) -> Tuple[int, int, int, int, Iterable[Dict[str, object]]]:
-    """Читает SVG-шрифт и возвращает метрики и глифы."""
+SVG_NS = "http://www.w3.org/2000/svg"
+# Полные (Clark) имена нужных тегов -> локальное имя; строятся один раз,
+# чтобы не разбирать пространство имён у каждого элемента.
+_FONT_TAGS = {
+    **{f"{{{SVG_NS}}}{name}": name for name in ("font", "font-face", "glyph")},
+    **{name: name for name in ("font", "font-face", "glyph")},
+}
+
+
+def _iter_svg_font_elements(svg_path: Path) -> Iterator[Tuple[str, str, Dict[str, str]]]:
+    """Потоково выдаёт (событие, локальное имя тега, атрибуты) для <font>/<font-face>/<glyph>.
+
+    Использует lxml.etree.iterparse с фильтром по тегам, если lxml установлен,
+    иначе — iterparse из стандартной библиотеки. Обработанные глифы сразу
+    очищаются, поэтому память не растёт с числом глифов.
+    """
+    try:
+        from lxml import etree as lxml_etree
+    except ImportError:  # pragma: no cover
+        lxml_etree = None
+
+    if lxml_etree is not None:
+        context = lxml_etree.iterparse(
+            str(svg_path),
+            events=("start", "end"),
+            tag=tuple(_FONT_TAGS),
+        )
+        for event, elem in context:
+            yield event, _FONT_TAGS[elem.tag], elem.attrib
+            if event == "end":
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+        return
+
+    import xml.etree.ElementTree as ET
+
+    for event, elem in ET.iterparse(svg_path, events=("start", "end")):
+        local = _FONT_TAGS.get(elem.tag)
+        if local is not None:
+            yield event, local, elem.attrib
+            if event == "end" and local == "glyph":
+                elem.clear()
+
+
+def _parse_svg_font(
+    svg_path: Path,
+) -> Tuple[int, int, int, int, List[str], List[str | None], List[int], List[str]]:
+    """Читает SVG-шрифт и возвращает метрики и глифы.
+
+    Глифы возвращаются параллельными списками (имена, пути d, ширины,
+    юникоды) вместо списка словарей.
+    """
     if not svg_path.exists():
         raise FileNotFoundError(f"SVG-файл не найден: {svg_path}")
     if svg_path.stat().st_size == 0:
         raise ValueError(f"SVG-файл пуст: {svg_path}")
 
-    tree = ET.parse(svg_path)
-    root = tree.getroot()
-    ns = {"svg": root.tag.split("}")[0].strip("{") if "}" in root.tag else ""}
+    font_attrib: Dict[str, str] | None = None
+    face_attrib: Dict[str, str] | None = None
+    glyph_attribs: list[Dict[str, str]] = []
+    in_font = False
+
+    # Берём первый <font>, его <font-face> и все <glyph> внутри него.
+    for event, local, attrib in _iter_svg_font_elements(svg_path):
+        if local == "font":
+            if event == "start" and font_attrib is None:
+                font_attrib = dict(attrib)
+                in_font = True
+            elif event == "end" and in_font:
+                break
+        elif not in_font or event != "end":
+            continue
+        elif local == "font-face":
+            if face_attrib is None:
+                face_attrib = dict(attrib)
+        else:
+            glyph_attribs.append(dict(attrib))
 
-    font_el = root.find(".//svg:font", ns) if ns["svg"] else root.find(".//font")
-    if font_el is None:
+    if font_attrib is None:
         raise ValueError("В файле не найден тег <font>")
 
-    font_face = font_el.find("svg:font-face", ns) if ns["svg"] else font_el.find("font-face")
-    units_per_em = int(font_face.attrib.get("units-per-em", "1000")) if font_face is not None else 1000
-    ascent = int(font_face.attrib.get("ascent", str(int(units_per_em * 0.8)))) if font_face is not None else int(
+    units_per_em = int(face_attrib.get("units-per-em", "1000")) if face_attrib is not None else 1000
+    ascent = int(face_attrib.get("ascent", str(int(units_per_em * 0.8)))) if face_attrib is not None else int(
         units_per_em * 0.8
     )
-    descent_raw = font_face.attrib.get("descent") if font_face is not None else None
+    descent_raw = face_attrib.get("descent") if face_attrib is not None else None
     descent = abs(int(descent_raw)) if descent_raw is not None else int(units_per_em * 0.2)
-    default_advance = int(font_el.attrib.get("horiz-adv-x", str(units_per_em)))
+    default_advance = int(font_attrib.get("horiz-adv-x", str(units_per_em)))
 
-    glyph_elements = font_el.findall("svg:glyph", ns) if ns["svg"] else font_el.findall("glyph")
-    glyphs = []
-    for idx, glyph_el in enumerate(glyph_elements):
-        unicode_val = glyph_el.attrib.get("unicode")
-        d = glyph_el.attrib.get("d")
-        adv = int(glyph_el.attrib.get("horiz-adv-x", default_advance))
+    names: List[str] = []
+    paths: List[str | None] = []
+    advances: List[int] = []
+    unicodes: List[str] = []
+    for idx, glyph_attrib in enumerate(glyph_attribs):
+        unicode_val = glyph_attrib.get("unicode")
+        d = glyph_attrib.get("d")
+        adv = int(glyph_attrib.get("horiz-adv-x", default_advance))
 
         if unicode_val is None:
             # Пропускаем пустые элементы без юникода
             continue
 
-        name = glyph_el.attrib.get("glyph-name")
+        name = glyph_attrib.get("glyph-name")
         if not name:
             if len(unicode_val) == 1:
                 name = f"uni{ord(unicode_val):04X}"
             else:
                 name = f"glyph_{idx}"
 
-        glyphs.append({
-            "name": name,
-            "unicode": unicode_val,
-            "path": d,
-            "advance": adv,
-        })
-
-    return units_per_em, ascent, descent, default_advance, glyphs
-
-
-def _draw_path_to_pen(path: SvgPath, pen: TransformPen) -> None:
-    """Рисует сегменты SVG-пути в pen."""
-    current_subpath_start = None
-    current_point = None
-
-    for segment in path:
-        start = (segment.start.real, segment.start.imag)
-        end = (segment.end.real, segment.end.imag)
-
-        if current_point is None or start != current_point:
-            # Новая под-петля
-            pen.moveTo(start)
-            current_subpath_start = start
-
-        if isinstance(segment, Line):
-            pen.lineTo(end)
-        elif isinstance(segment, QuadraticBezier):
-            pen.qCurveTo((segment.control.real, segment.control.imag), end)
-        elif isinstance(segment, CubicBezier):
-            pen.curveTo(
-                (segment.control1.real, segment.control1.imag),
-                (segment.control2.real, segment.control2.imag),
-                end,
-            )
-        elif isinstance(segment, Arc):
-            for cubic in segment.as_cubic_curves():
-                pen.curveTo(
-                    (cubic.control1.real, cubic.control1.imag),
-                    (cubic.control2.real, cubic.control2.imag),
-                    (cubic.end.real, cubic.end.imag),
-                )
-        else:
-            raise ValueError(f"Неизвестный тип сегмента: {type(segment)}")
+        names.append(name)
+        paths.append(d)
+        advances.append(adv)
+        unicodes.append(unicode_val)
+
+    return units_per_em, ascent, descent, default_advance, names, paths, advances, unicodes
+
+
+_PATH_TOKEN_RE = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+# Команда пути -> (команда в верхнем регистре, относительная ли она).
+# Разбирается один раз на токен команды, а не на каждый повтор координат.
+_PATH_COMMANDS = {cmd: (cmd.upper(), cmd.islower()) for cmd in "MmLlHhVvCcSsQqTtAaZz"}
+
+
+def _draw_d_to_pen(d: str, pen: TransformPen) -> None:
+    """Разбирает атрибут d за один проход и рисует сегменты прямо в pen.
+
+    Дуги (A/a) аппроксимируются кубиками через svgpathtools, остальные
+    команды обрабатываются без создания промежуточных объектов.
+    """
+    tokens = _PATH_TOKEN_RE.findall(d)
+    count = len(tokens)
+    idx = 0
+
+    def number() -> float:
+        nonlocal idx
+        value = float(tokens[idx])
+        idx += 1
+        return value
+
+    def flag() -> bool:
+        # Флаги дуг могут быть записаны слитно с числами: "a1 1 0 011 1".
+        nonlocal idx
+        token = tokens[idx]
+        if len(token) > 1 and token[0] in "01":
+            tokens[idx] = token[1:]
+            return token[0] == "1"
+        idx += 1
+        return token == "1"
+
+    cx = cy = 0.0  # текущая точка
+    sx = sy = 0.0  # начало под-петли
+    ctrl = None  # последняя контрольная точка для S/T
+    contour_open = False
+    op = ""
+    relative = False
+
+    while idx < count:
+        token = tokens[idx]
+        command = _PATH_COMMANDS.get(token)
+        if command is not None:
+            op, relative = command
+            idx += 1
+            if op == "Z":
+                if contour_open:
+                    pen.closePath()
+                    contour_open = False
+                cx, cy = sx, sy
+                ctrl = None
+                continue
+        elif not op or op == "Z":
+            raise ValueError(f"Неожиданный токен в пути: {token!r}")
+
+        if op == "M":
+            x, y = number(), number()
+            if relative:
+                x += cx
+                y += cy
+            if contour_open:
+                pen.endPath()
+                contour_open = False
+            cx, cy = sx, sy = x, y
+            ctrl = None
+            # Повторные пары координат после M трактуются как L (l).
+            op = "L"
+            continue
 
-        current_point = end
+        if not contour_open:
+            pen.moveTo((cx, cy))
+            sx, sy = cx, cy
+            contour_open = True
+
+        if op == "L":
+            x, y = number(), number()
+            if relative:
+                x += cx
+                y += cy
+            pen.lineTo((x, y))
+            ctrl = None
+        elif op == "H":
+            x = number()
+            if relative:
+                x += cx
+            y = cy
+            pen.lineTo((x, y))
+            ctrl = None
+        elif op == "V":
+            y = number()
+            if relative:
+                y += cy
+            x = cx
+            pen.lineTo((x, y))
+            ctrl = None
+        elif op in "CS":
+            if op == "C":
+                x1, y1 = number(), number()
+                if relative:
+                    x1 += cx
+                    y1 += cy
+            elif ctrl is not None and ctrl[0] == "C":
+                x1, y1 = 2 * cx - ctrl[1], 2 * cy - ctrl[2]
+            else:
+                x1, y1 = cx, cy
+            x2, y2, x, y = number(), number(), number(), number()
+            if relative:
+                x2 += cx
+                y2 += cy
+                x += cx
+                y += cy
+            pen.curveTo((x1, y1), (x2, y2), (x, y))
+            ctrl = ("C", x2, y2)
+        elif op in "QT":
+            if op == "Q":
+                x1, y1 = number(), number()
+                if relative:
+                    x1 += cx
+                    y1 += cy
+            elif ctrl is not None and ctrl[0] == "Q":
+                x1, y1 = 2 * cx - ctrl[1], 2 * cy - ctrl[2]
+            else:
+                x1, y1 = cx, cy
+            x, y = number(), number()
+            if relative:
+                x += cx
+                y += cy
+            pen.qCurveTo((x1, y1), (x, y))
+            ctrl = ("Q", x1, y1)
+        elif op == "A":
+            rx, ry, rotation = abs(number()), abs(number()), number()
+            large_arc, sweep = flag(), flag()
+            x, y = number(), number()
+            if relative:
+                x += cx
+                y += cy
+            if (x, y) != (cx, cy):
+                if rx == 0 or ry == 0:
+                    pen.lineTo((x, y))
+                else:
+                    from svgpathtools import Arc
+
+                    arc = Arc(complex(cx, cy), complex(rx, ry), rotation, large_arc, sweep, complex(x, y))
+                    for cubic in arc.as_cubic_curves():
+                        pen.curveTo(
+                            (cubic.control1.real, cubic.control1.imag),
+                            (cubic.control2.real, cubic.control2.imag),
+                            (cubic.end.real, cubic.end.imag),
+                        )
+            ctrl = None
+        else:
+            raise ValueError(f"Неизвестная команда пути: {op}")
 
-        if current_subpath_start and end == current_subpath_start:
-            pen.closePath()
-            current_subpath_start = None
+        cx, cy = x, y
 
-    if current_subpath_start is not None:
+    if contour_open:
         pen.endPath()
 
 
-def _build_glyph(path_data: str, upm: int, ascent: int) -> TTGlyphPen:
-    """Создаёт TTGlyph из атрибута d."""
+@lru_cache(maxsize=None)
+def _glyph_pens(ascent: int) -> Tuple[TTGlyphPen, TransformPen]:
+    """Возвращает переиспользуемую цепочку TransformPen -> Cu2QuPen -> TTGlyphPen.
+
+    TTGlyphPen.glyph() сбрасывает накопленные контуры, поэтому одну цепочку
+    можно использовать для всех глифов процесса вместо сборки новой на каждый.
+    """
+    from fontTools.pens.cu2quPen import Cu2QuPen
+    from fontTools.pens.transformPen import TransformPen
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
     tt_pen = TTGlyphPen(None)
     cu2qu_pen = Cu2QuPen(tt_pen, max_err=1.0, reverse_direction=False)
-    transform_pen = TransformPen(cu2qu_pen, (1, 0, 0, -1, 0, ascent))
-    svg_path = parse_path(path_data)
-    _draw_path_to_pen(svg_path, transform_pen)
+    return tt_pen, TransformPen(cu2qu_pen, (1, 0, 0, -1, 0, ascent))
+
+
+def _build_glyph(path_data: str, upm: int, ascent: int) -> TTGlyphPen:
+    """Создаёт TTGlyph из атрибута d."""
+    tt_pen, transform_pen = _glyph_pens(ascent)
+    # Сбрасываем остатки на случай, если предыдущий глиф упал посреди контура.
+    tt_pen.init()
+    _draw_d_to_pen(path_data, transform_pen)
     return tt_pen.glyph()
 
 
-def convert(svg_path: Path, ttf_path: Path) -> None:
-    upm, ascent, descent, default_adv, glyph_entries = _parse_svg_font(svg_path)
+def _build_glyph_worker(args: Tuple[str | None, int, int]) -> object:
+    """Обёртка над _build_glyph для ProcessPoolExecutor (должна пиклиться)."""
+    path_data, upm, ascent = args
+    if not path_data:
+        from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+        # Разрешаем пустые глифы (например, пробел)
+        return TTGlyphPen(None).glyph()
+    return _build_glyph(path_data, upm, ascent)
+
+
+def _inputs_digest(*parts: object) -> str:
+    """Хэш входных данных сборки вместе с исходником этого скрипта.
+
+    Исходник входит в хэш, чтобы любое изменение логики сборки
+    инвалидировало ранее сохранённый кэш.
+    """
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=32)
+    digest.update(repr(parts).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_path(ttf_path: Path) -> Path:
+    return ttf_path.with_suffix(".ttf.cache")
+
+
+def _restore_from_cache(ttf_path: Path, digest: str) -> bool:
+    """Восстанавливает TTF из кэша, если хэш входных данных совпал."""
+    cache = _cache_path(ttf_path)
+    if not cache.exists():
+        return False
+    header, _, data = cache.read_bytes().partition(b"\n")
+    if header.decode("ascii", errors="ignore") != digest or not data:
+        return False
+    ttf_path.parent.mkdir(parents=True, exist_ok=True)
+    ttf_path.write_bytes(data)
+    return True
+
+
+def convert(svg_path: Path, ttf_path: Path, jobs: int | None = None, use_cache: bool = True) -> None:
+    upm, ascent, descent, default_adv, names, paths, advances, unicodes = _parse_svg_font(svg_path)
+
+    # Если входные данные не менялись, берём готовый TTF из кэша и не
+    # пересобираем ни глифы, ни таблицы.
+    digest = _inputs_digest(upm, ascent, descent, default_adv, names, paths, advances, unicodes)
+    if use_cache and _restore_from_cache(ttf_path, digest):
+        return
+
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
 
     glyph_order = [".notdef"]
     glyphs = {".notdef": TTGlyphPen(None).glyph()}
     h_metrics: Dict[str, Tuple[int, int]] = {".notdef": (default_adv, 0)}
     cmap = {}
 
-    for entry in glyph_entries:
-        path_data = entry["path"]
-        name = entry["name"]  # type: ignore[index]
-        unicode_val = entry["unicode"]  # type: ignore[index]
-        advance = entry["advance"]  # type: ignore[index]
+    # Глифы независимы друг от друга — собираем их параллельно в процессах.
+    # При одном процессе или паре глифов пул только добавит запуск и пиклинг.
+    work = [(path_data, upm, ascent) for path_data in paths]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(work) <= 1:
+        built = [_build_glyph_worker(item) for item in work]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
 
-        if not path_data:
-            # Разрешаем пустые глифы (например, пробел)
-            glyph_obj = TTGlyphPen(None).glyph()
-        else:
-            glyph_obj = _build_glyph(path_data, upm, ascent)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            built = list(pool.map(_build_glyph_worker, work, chunksize=64))
 
+    for name, glyph_obj, advance, unicode_val in zip(names, built, advances, unicodes):
         glyph_order.append(name)
         glyphs[name] = glyph_obj
         h_metrics[name] = (advance, 0)
@@ -183,6 +431,9 @@ def convert(svg_path: Path, ttf_path: Path) -> None:
     ttf_path.parent.mkdir(parents=True, exist_ok=True)
     fb.save(str(ttf_path))
 
+    if use_cache:
+        _cache_path(ttf_path).write_bytes(digest.encode("ascii") + b"\n" + ttf_path.read_bytes())
+
 
 def main(argv: list[str]) -> int:
     parser = argparse.ArgumentParser(description="Конвертация SVG-шрифта в TTF")
@@ -198,10 +449,23 @@ def main(argv: list[str]) -> int:
         default=Path("c:/iconflow/tp/lucide/lucide-font/lucide.from-svg.ttf"),
         help="Куда сохранить TTF",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Количество процессов для сборки глифов (по умолчанию = числу ядер)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Не использовать и не обновлять кэш <dst>.cache с результатом прошлой сборки",
+    )
     args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs должно быть не меньше 1")
 
     try:
-        convert(args.src, args.dst)
+        convert(args.src, args.dst, args.jobs, use_cache=not args.no_cache)
     except Exception as exc:  # noqa: BLE001
         print(f"Ошибка конвертации: {exc}", file=sys.stderr)
         return 1
@@ -19,9 +19,10 @@ import argparse
 import os
 import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Iterable, Iterator, Tuple
 
 
 def _build_cmd(inkscape: str, src: Path, dst: Path) -> list[str]:
@@ -35,18 +36,15 @@ def _build_cmd(inkscape: str, src: Path, dst: Path) -> list[str]:
     ]
 
 
-def _process_one(inkscape: str, src: Path, dst: Path, force: bool) -> Tuple[Path, bool, str]:
+def _process_one(inkscape: str, src: Path, dst: Path) -> Tuple[Path, bool, str]:
     """Обрабатывает один SVG. Возвращает (файл, успех, stderr)."""
-    if dst.exists() and not force:
-        # Уже есть и не форсим — пропускаем.
-        return src, True, ""
-
     cmd = _build_cmd(inkscape, src, dst)
     try:
-        proc = subprocess.run(
+        # stdout Inkscape не нужен — отправляем в DEVNULL, храним только stderr.
+        subprocess.run(
             cmd,
             check=True,
-            stdout=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
             stderr=subprocess.PIPE,
         )
     except subprocess.CalledProcessError as exc:  # noqa: BLE001
@@ -55,6 +53,48 @@ def _process_one(inkscape: str, src: Path, dst: Path, force: bool) -> Tuple[Path
     return src, True, ""
 
 
+def _chunked(items: Iterable[Tuple[Path, Path]], size: int) -> Iterator[list[Tuple[Path, Path]]]:
+    """Лениво режет последовательность на пачки по size элементов."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _build_shell_script(batch: list[Tuple[Path, Path]]) -> str:
+    """Строит команды для `inkscape --shell`: по одной строке действий на файл."""
+    lines = [
+        f"file-open:{src}; select-all:all; object-stroke-to-path; "
+        f"export-type:svg; export-plain-svg; export-filename:{dst}; export-do; file-close"
+        for src, dst in batch
+    ]
+    lines.append("quit")
+    return "\n".join(lines) + "\n"
+
+
+def _process_batch(inkscape: str, batch: list[Tuple[Path, Path]]) -> list[Tuple[Path, bool, str]]:
+    """Обрабатывает пачку SVG одним процессом Inkscape в режиме --shell.
+
+    Запуск Inkscape занимает до секунды, поэтому несколько файлов
+    прогоняются через один процесс. Успех определяется по тому, что
+    выходной файл появился или обновился; упавшие файлы уходят на
+    повторную попытку через `_process_one`.
+    """
+    before = {dst: dst.stat().st_mtime_ns if dst.exists() else None for _, dst in batch}
+    proc = subprocess.run(
+        [inkscape, "--shell"],
+        input=_build_shell_script(batch).encode(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    stderr = proc.stderr.decode(errors="ignore") or "<пусто>"
+
+    results: list[Tuple[Path, bool, str]] = []
+    for src, dst in batch:
+        ok = dst.exists() and dst.stat().st_mtime_ns != before[dst]
+        results.append((src, ok, "" if ok else stderr))
+    return results
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Expand stroke->path для всех SVG в каталоге через Inkscape")
     parser.add_argument(
@@ -68,6 +108,12 @@ def main() -> int:
         default=max(os.cpu_count() or 4, 4),
         help="Количество параллельных процессов Inkscape (по умолчанию ~= числу ядер, но не меньше 4)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=50,
+        help="Сколько SVG обрабатывать одним процессом Inkscape (--shell)",
+    )
     parser.add_argument(
         "--src-dir",
         type=Path,
@@ -95,9 +141,16 @@ def main() -> int:
     if not icons_dir.exists():
         raise SystemExit(f"Папка с иконками не найдена: {icons_dir}")
 
-    svg_files = sorted(p for p in icons_dir.glob("*.svg") if p.is_file())
+    # os.scandir отдаёт тип записи из readdir, без отдельного stat на файл.
+    # Заодно запоминаем mtime исходников, чтобы не пересобирать неизменённые.
+    src_mtimes: dict[str, float] = {}
+    with os.scandir(icons_dir) as it:
+        for e in it:
+            if e.name.endswith(".svg") and e.is_file(follow_symlinks=False):
+                src_mtimes[e.name] = e.stat().st_mtime
+    svg_files = [icons_dir / name for name in sorted(src_mtimes)]
     if not svg_files:
-        raise SystemExit(f"В {ICONS_DIR} нет *.svg")
+        raise SystemExit(f"В {icons_dir} нет *.svg")
 
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -109,22 +162,38 @@ def main() -> int:
     print(f"Параллельных задач: {args.jobs}")
     print()
 
-    # --- Первый прогон: параллельно ---
-    futures = []
-    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
-        for src in svg_files:
-            dst = out_dir / src.name
-            futures.append(pool.submit(_process_one, inkscape, src, dst, args.force))
-
-        errors_parallel: list[Tuple[Path, str]] = []
-        done_count = 0
-        for fut in as_completed(futures):
-            src, ok, stderr = fut.result()
+    # Файлы, результат для которых новее исходника, пропускаем, если не форсим.
+    with os.scandir(out_dir) as it:
+        dst_mtimes = {e.name: e.stat().st_mtime for e in it if e.is_file(follow_symlinks=False)}
+    pending: list[Tuple[Path, Path]] = []
+    done_count = 0
+    for src in svg_files:
+        dst = out_dir / src.name
+        dst_mtime = dst_mtimes.get(src.name)
+        if not args.force and dst_mtime is not None and dst_mtime >= src_mtimes[src.name]:
             done_count += 1
-            prefix = "OK " if ok else "ERR"
-            print(f"[{done_count}/{total}] {prefix} {src.name}")
-            if not ok:
-                errors_parallel.append((src, stderr))
+            print(f"[{done_count}/{total}] OK  {src.name}")
+            continue
+        pending.append((src, dst))
+
+    # --- Первый прогон: параллельно, пачками через inkscape --shell ---
+    # В полёте держим не больше jobs * 2 пачек, остальные подаём по мере готовности.
+    batches = _chunked(pending, max(args.batch_size, 1))
+    max_in_flight = max(args.jobs, 1) * 2
+    errors_parallel: list[Tuple[Path, str]] = []
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        in_flight = {pool.submit(_process_batch, inkscape, batch) for batch in islice(batches, max_in_flight)}
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for fut in done:
+                for src, ok, stderr in fut.result():
+                    done_count += 1
+                    prefix = "OK " if ok else "ERR"
+                    print(f"[{done_count}/{total}] {prefix} {src.name}")
+                    if not ok:
+                        errors_parallel.append((src, stderr))
+            for batch in islice(batches, len(done)):
+                in_flight.add(pool.submit(_process_batch, inkscape, batch))
 
     # --- Второй прогон: последовательный только для упавших файлов ---
     errors_final: list[Tuple[Path, str]] = []
@@ -135,7 +204,7 @@ def main() -> int:
         )
         for src, _ in errors_parallel:
             dst = out_dir / src.name
-            _, ok, stderr = _process_one(inkscape, src, dst, force=True)
+            _, ok, stderr = _process_one(inkscape, src, dst)
             prefix = "OK " if ok else "ERR"
             print(f"[retry] {prefix} {src.name}")
             if not ok:
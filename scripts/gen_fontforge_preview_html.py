@@ -9,6 +9,7 @@ sorted(tp/lucide/icons/*.svg), кодпоинты от U+E000.
 from __future__ import annotations
 
 import html
+import os
 from pathlib import Path
 
 START_CODEPOINT = 0xE000
@@ -17,6 +18,20 @@ EXPANDED_ICONS_DIR = BASE_ICONS_DIR.parent / "icons-expanded"
 TTF_PATH = Path("c:/iconflow/tp/lucide/lucide-font/lucide.fontforge.ttf")
 OUT_HTML = Path("c:/iconflow/tp/lucide/lucide-font/lucide.fontforge-preview.html")
 
+# Разметка одной ячейки сетки: глиф из TTF рядом с исходным SVG.
+ROW_TEMPLATE = (
+    "<div class='icon-item'>"
+    "  <div class='icon-row'>"
+    "    <div class='icon-glyph'>&#x{cp};</div>"
+    "    <img class='icon-svg' src='../{folder}/{svg_name}' alt='{name}' />"
+    "  </div>"
+    "  <div class='icon-meta'>"
+    "    <div class='icon-name'>{name}</div>"
+    "    <div class='icon-code'>U+{cp}</div>"
+    "  </div>"
+    "</div>"
+)
+
 
 def main() -> None:
     if not TTF_PATH.exists():
@@ -29,31 +44,28 @@ def main() -> None:
     if not icons_dir.exists():
         raise SystemExit(f"Папка с иконками не найдена: {icons_dir}")
 
-    svg_files = sorted([p for p in icons_dir.glob("*.svg") if p.is_file()])
-    if not svg_files:
+    # Работаем с именами файлов напрямую: Path для каждой иконки не нужен.
+    with os.scandir(icons_dir) as it:
+        svg_names = sorted(e.name for e in it if e.name.endswith(".svg") and e.is_file(follow_symlinks=False))
+    if not svg_names:
         raise SystemExit(f"В {icons_dir} нет *.svg")
 
-    rows = []
-    codepoint = START_CODEPOINT
-    for svg in svg_files:
-        name = svg.stem
-        cp_hex = f"{codepoint:04X}"
-        # Путь к исходному SVG относителен HTML-файла
-        rel_folder = "icons-expanded" if EXPANDED_ICONS_DIR.exists() else "icons"
-        svg_rel = f"../{rel_folder}/{html.escape(svg.name)}"
-        rows.append(
-            f"<div class='icon-item'>"
-            f"  <div class='icon-row'>"
-            f"    <div class='icon-glyph'>&#x{cp_hex};</div>"
-            f"    <img class='icon-svg' src='{svg_rel}' alt='{html.escape(name)}' />"
-            f"  </div>"
-            f"  <div class='icon-meta'>"
-            f"    <div class='icon-name'>{html.escape(name)}</div>"
-            f"    <div class='icon-code'>U+{cp_hex}</div>"
-            f"  </div>"
-            f"</div>"
+    # Путь к исходному SVG относителен HTML-файла
+    rel_folder = "icons-expanded" if EXPANDED_ICONS_DIR.exists() else "icons"
+    # Каждое имя экранируется ровно один раз: {name} в шаблоне используется
+    # и для alt, и для подписи.
+    escape = html.escape
+    # Hex-коды считаются одним проходом; в шаблоне {cp} подставляется дважды.
+    hex_codes = [f"{cp:04X}" for cp in range(START_CODEPOINT, START_CODEPOINT + len(svg_names))]
+    rows_html = "".join(
+        ROW_TEMPLATE.format(
+            cp=cp_hex,
+            folder=rel_folder,
+            svg_name=escape(svg_name),
+            name=escape(svg_name[:-4]),
         )
-        codepoint += 1
+        for svg_name, cp_hex in zip(svg_names, hex_codes)
+    )
 
     html_doc = f"""<!DOCTYPE html>
 <html lang=\"en\">
@@ -142,7 +154,7 @@ def main() -> None:
   <h1>Lucide FontForge Preview</h1>
   <p>Шрифт: {html.escape(str(TTF_PATH.name))}, глифы от U+{START_CODEPOINT:04X} по порядку файлов в {html.escape(str(icons_dir))}.</p>
   <div class='grid'>
-    {''.join(rows)}
+    {rows_html}
   </div>
 </body>
 </html>
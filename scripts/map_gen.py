@@ -2,16 +2,30 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
 from fontTools.ttLib import TTFont
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
 
 ASSETS_FONTS_DIR = Path("assets/fonts")
 MAPS_DIR = Path("assets/maps")
+# v1: one object per icon (read by xtask); v2: columnar layout.
+MAP_SCHEMA = os.environ.get("MAP_SCHEMA", "v1")
+# Compact JSON for machine consumers; indent=2 by default for readable diffs.
+COMPACT_MAPS = os.environ.get("ICONFLOW_COMPACT_MAPS", "") not in ("", "0")
 
 PACK_TITLES = {
     "bootstrap": "Bootstrap",
@@ -31,10 +45,23 @@ PACK_TITLES = {
 }
 
 NAME_PATTERN = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+NON_KEBAB_RUN = re.compile(r"[^a-z0-9]+")
+FLUENT_NAME_PATTERN = re.compile(r"^ic_fluent_(.+)_(\d+)_(regular|filled|light)$")
+OCTICONS_NAME_PATTERN = re.compile(r"^(?P<base>.+?)(?P<fill>-fill)?-(?P<size>\d+)$")
+REMIX_UNICODE_PATTERN = re.compile(r"&#x([0-9a-fA-F]+);")
+
 
+@lru_cache(maxsize=None)
+def _open_font(path: str) -> TTFont:
+    # One TTFont per file: load_family and load_cmap read different tables
+    # of the same font, and lazy=True decodes only those.
+    return TTFont(path, lazy=True)
 
+
+@lru_cache(maxsize=None)
 def load_family(path: Path) -> str:
-    font = TTFont(path)
+    # Cached: several variants can share one TTF.
+    font = _open_font(str(path))
     families = []
     for record in font["name"].names:
         if record.nameID == 1:
@@ -51,30 +78,34 @@ def load_family(path: Path) -> str:
 
 
 def load_cmap(path: Path) -> Dict[str, int]:
-    font = TTFont(path)
-    cmap = font.getBestCmap() or {}
+    font = _open_font(str(path))
+    # getBestCmap returns the chosen subtable's own dict, so no copy is made.
+    cmap = font["cmap"].getBestCmap() or {}
     name_to_cp: Dict[str, int] = {}
+    duplicates: List[Tuple[str, int]] = []
     for cp, name in cmap.items():
-        if name in name_to_cp:
-            if name_to_cp[name] == cp:
-                continue
-            existing = name_to_cp[name]
-            chosen = min(existing, cp)
-            name_to_cp[name] = chosen
-            print(
-                f"Warning: duplicate glyph name '{name}' in {path} ({existing} vs {cp}); keeping {chosen}",
-                file=sys.stderr,
-            )
-            continue
-        name_to_cp[name] = cp
+        if name_to_cp.setdefault(name, cp) != cp:
+            duplicates.append((name, cp))
+    # Rare case: resolve repeated glyph names after the hot loop, in cmap order.
+    for name, cp in duplicates:
+        existing = name_to_cp[name]
+        chosen = min(existing, cp)
+        name_to_cp[name] = chosen
+        print(
+            f"Warning: duplicate glyph name '{name}' in {path} ({existing} vs {cp}); keeping {chosen}",
+            file=sys.stderr,
+        )
     return name_to_cp
 
 
+@lru_cache(maxsize=1 << 17)
 def normalize_kebab(name: str) -> str:
-    cleaned = name.strip().lower().replace("_", "-")
-    cleaned = re.sub(r"[^a-z0-9-]+", "-", cleaned)
-    cleaned = re.sub(r"-{2,}", "-", cleaned)
-    cleaned = cleaned.strip("-")
+    # Most glyph names are already kebab-case: one anchored match and done.
+    if NAME_PATTERN.fullmatch(name):
+        return name
+    # Any run of characters outside [a-z0-9] (whitespace, "_", repeated "-")
+    # collapses to a single "-" in one pass; edge dashes are stripped after.
+    cleaned = NON_KEBAB_RUN.sub("-", name.lower()).strip("-")
     if not cleaned or not NAME_PATTERN.match(cleaned):
         raise ValueError(f"Invalid icon name after normalization: '{name}' -> '{cleaned}'")
     return cleaned
@@ -86,58 +117,93 @@ def merge_variants(
     default_variant_id: str | None,
 ) -> List[dict]:
     variant_ids = [variant["id"] for variant in variants]
-    all_names = sorted({name for names in variant_maps.values() for name in names})
+    # Invert the maps once: name -> variants, in variant_ids order.
+    name_to_variants: Dict[str, List[str]] = defaultdict(list)
+    for vid in variant_ids:
+        for name in variant_maps.get(vid, {}):
+            name_to_variants[name].append(vid)
+    num_variants = len(variant_ids)
+    default_map = variant_maps.get(default_variant_id, {}) if default_variant_id else {}
     icons: List[dict] = []
 
-    for name in all_names:
-        available = [vid for vid in variant_ids if name in variant_maps.get(vid, {})]
-        if not available:
-            continue
-        default_cp = None
-        if default_variant_id and name in variant_maps.get(default_variant_id, {}):
-            default_cp = variant_maps[default_variant_id][name]
+    for name in sorted(name_to_variants):
+        available = name_to_variants[name]
+        default_cp = default_map.get(name)
 
-        overrides: Dict[str, int] = {}
+        icon_entry = {"name": name}
         if default_cp is None:
-            for vid in available:
-                overrides[vid] = variant_maps[vid][name]
+            overrides = {vid: variant_maps[vid][name] for vid in available}
         else:
-            for vid in available:
-                if vid == default_variant_id:
-                    continue
-                cp = variant_maps[vid][name]
-                if cp != default_cp:
-                    overrides[vid] = cp
-
-        icon_entry = {"name": name}
-        if default_cp is not None:
             icon_entry["codepoint"] = default_cp
+            overrides = {
+                vid: cp
+                for vid in available
+                if vid != default_variant_id and (cp := variant_maps[vid][name]) != default_cp
+            }
         if overrides:
             icon_entry["overrides"] = overrides
-        if len(available) != len(variant_ids):
+        if len(available) != num_variants:
             icon_entry["availability"] = available
         icons.append(icon_entry)
 
     return icons
 
 
+def icons_to_columns(icons: List[dict], variant_ids: List[str]) -> dict:
+    names: List[str] = []
+    codepoints: List[int | None] = []
+    overrides: Dict[str, List[int | None]] = {vid: [] for vid in variant_ids}
+    availability: List[List[str] | None] = []
+    for icon in icons:
+        names.append(icon["name"])
+        codepoints.append(icon.get("codepoint"))
+        icon_overrides = icon.get("overrides", {})
+        for vid, column in overrides.items():
+            column.append(icon_overrides.get(vid))
+        availability.append(icon.get("availability"))
+    return {
+        "names": names,
+        "codepoints": codepoints,
+        "overrides": {vid: column for vid, column in overrides.items() if any(cp is not None for cp in column)},
+        "availability": availability,
+    }
+
+
 def write_map(pack_id: str, variants: List[dict], icons: List[dict]) -> None:
     MAPS_DIR.mkdir(parents=True, exist_ok=True)
-    payload = {
-        "pack_id": pack_id,
-        "variants": sorted(variants, key=lambda v: v["id"]),
-        "icons": sorted(icons, key=lambda i: i["name"]),
-    }
+    sorted_variants = sorted(variants, key=itemgetter("id"))
+    # merge_variants already returns icons sorted by name.
+    payload = {"pack_id": pack_id, "variants": sorted_variants}
+    if MAP_SCHEMA == "v2":
+        payload["icons"] = icons_to_columns(icons, [variant["id"] for variant in sorted_variants])
+    else:
+        payload["icons"] = icons
     path = MAPS_DIR / f"{pack_id}.json"
-    path.write_text(json.dumps(payload, ensure_ascii=True, indent=2) + "\n", encoding="utf-8")
+    if COMPACT_MAPS:
+        if orjson is not None:
+            text = orjson.dumps(payload, option=orjson.OPT_APPEND_NEWLINE).decode("utf-8")
+        else:
+            text = json.dumps(payload, ensure_ascii=True, separators=(",", ":")) + "\n"
+    elif orjson is not None:
+        # Same layout as json.dumps(indent=2); names are ASCII kebab-case.
+        text = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode("utf-8")
+    else:
+        text = json.dumps(payload, ensure_ascii=True, indent=2) + "\n"
+    path.write_text(text, encoding="utf-8")
 
 
 def ttf_path(pack_id: str, filename: str) -> Path:
     return ASSETS_FONTS_DIR / pack_id / filename
 
 
+def read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def load_icomoon_selection(path: Path) -> Dict[str, int]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = read_json(path)
     icons = data.get("icons", [])
     name_to_cp: Dict[str, int] = {}
     for icon in icons:
@@ -154,7 +220,7 @@ def load_icomoon_selection(path: Path) -> Dict[str, int]:
 
 
 def parse_remixicon_glyphs(path: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = read_json(path)
     outline: Dict[str, int] = {}
     filled: Dict[str, int] = {}
     for raw_name, payload in data.items():
@@ -166,10 +232,10 @@ def parse_remixicon_glyphs(path: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
             target = filled
         else:
             continue
-        unicode = payload.get("unicode", "")
-        if not unicode.startswith("&#x") or not unicode.endswith(";"):
+        match = REMIX_UNICODE_PATTERN.fullmatch(payload.get("unicode", ""))
+        if not match:
             raise ValueError(f"Unexpected unicode format for {raw_name} in {path}")
-        codepoint = int(unicode[3:-1], 16)
+        codepoint = int(match.group(1), 16)
         if base in target and target[base] != codepoint:
             raise ValueError(f"Duplicate icon name '{base}' in {path}")
         target[base] = codepoint
@@ -177,7 +243,7 @@ def parse_remixicon_glyphs(path: Path) -> Tuple[Dict[str, int], Dict[str, int]]:
 
 
 def parse_fluent_name(name: str) -> Tuple[str, int, str] | None:
-    match = re.match(r"^ic_fluent_(.+)_(\d+)_(regular|filled|light)$", name)
+    match = FLUENT_NAME_PATTERN.match(name)
     if not match:
         return None
     raw_name, raw_size, raw_style = match.groups()
@@ -199,14 +265,14 @@ def generate_bootstrap() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(filled_path),
-            "ttf_asset_path": str(filled_path).replace("\\", "/"),
+            "ttf_asset_path": filled_path.as_posix(),
         },
     ]
     icons = merge_variants(variants, {"regular": regular_map, "filled": filled_map}, "regular")
@@ -228,21 +294,21 @@ def generate_heroicons() -> Tuple[List[dict], List[dict]]:
             "style": "Outline",
             "size": "Regular",
             "family": load_family(outline_path),
-            "ttf_asset_path": str(outline_path).replace("\\", "/"),
+            "ttf_asset_path": outline_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(filled_path),
-            "ttf_asset_path": str(filled_path).replace("\\", "/"),
+            "ttf_asset_path": filled_path.as_posix(),
         },
         {
             "id": "mini",
             "style": "Filled",
             "size": "Mini",
             "family": load_family(mini_path),
-            "ttf_asset_path": str(mini_path).replace("\\", "/"),
+            "ttf_asset_path": mini_path.as_posix(),
             "feature": "heroicons-mini",
         },
         {
@@ -250,7 +316,7 @@ def generate_heroicons() -> Tuple[List[dict], List[dict]]:
             "style": "Filled",
             "size": "Tiny",
             "family": load_family(tiny_path),
-            "ttf_asset_path": str(tiny_path).replace("\\", "/"),
+            "ttf_asset_path": tiny_path.as_posix(),
             "feature": "heroicons-tiny",
         },
     ]
@@ -285,28 +351,28 @@ def generate_carbon() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(filled_path),
-            "ttf_asset_path": str(filled_path).replace("\\", "/"),
+            "ttf_asset_path": filled_path.as_posix(),
         },
         {
             "id": "outline",
             "style": "Outline",
             "size": "Regular",
             "family": load_family(outline_path),
-            "ttf_asset_path": str(outline_path).replace("\\", "/"),
+            "ttf_asset_path": outline_path.as_posix(),
         },
         {
             "id": "glyph",
             "style": "Glyph",
             "size": "Regular",
             "family": load_family(glyph_path),
-            "ttf_asset_path": str(glyph_path).replace("\\", "/"),
+            "ttf_asset_path": glyph_path.as_posix(),
         },
     ]
     icons = merge_variants(
@@ -331,7 +397,7 @@ def generate_devicon() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         }
     ]
     icons = merge_variants(variants, {"regular": icon_map}, "regular")
@@ -347,7 +413,7 @@ def generate_feather() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         }
     ]
     icons = merge_variants(variants, {"regular": icon_map}, "regular")
@@ -386,7 +452,25 @@ def generate_fluentui() -> Tuple[List[dict], List[dict]]:
     variants: List[dict] = []
     variant_maps: Dict[str, Dict[str, int]] = {}
 
-    def add_variant(style: str, size: int | str, path: Path, icon_map: Dict[Tuple[str, int], int]) -> None:
+    def bucket_by_size(icon_map: Dict[Tuple[str, int], int]) -> Dict[int, Dict[str, int]]:
+        # One pass over the style map instead of a full rescan per size.
+        buckets: Dict[int, Dict[str, int]] = defaultdict(dict)
+        for (name, size), cp in icon_map.items():
+            buckets[size][name] = cp
+        return buckets
+
+    regular_family = load_family(regular_path)
+    filled_family = load_family(filled_path)
+    light_family = load_family(light_path)
+    resizable_family = load_family(resizable_path)
+
+    def add_variant(
+        style: str,
+        size: int | str,
+        path: Path,
+        family: str,
+        icon_map: Dict[str, int],
+    ) -> None:
         if isinstance(size, int):
             size_value: int | str = size
             size_suffix = str(size)
@@ -399,20 +483,18 @@ def generate_fluentui() -> Tuple[List[dict], List[dict]]:
                 "id": variant_id,
                 "style": style,
                 "size": size_value,
-                "family": load_family(path),
-                "ttf_asset_path": str(path).replace("\\", "/"),
+                "family": family,
+                "ttf_asset_path": path.as_posix(),
             }
         )
-        variant_maps[variant_id] = {
-            name: cp for (name, icon_size), cp in icon_map.items() if icon_size == size
-        }
+        variant_maps[variant_id] = icon_map
 
-    for size in sorted({size for _, size in regular_map.keys()}):
-        add_variant("Regular", size, regular_path, regular_map)
-    for size in sorted({size for _, size in filled_map.keys()}):
-        add_variant("Filled", size, filled_path, filled_map)
-    for size in sorted({size for _, size in light_map.keys()}):
-        add_variant("Light", size, light_path, light_map)
+    for size, icon_map in sorted(bucket_by_size(regular_map).items()):
+        add_variant("Regular", size, regular_path, regular_family, icon_map)
+    for size, icon_map in sorted(bucket_by_size(filled_map).items()):
+        add_variant("Filled", size, filled_path, filled_family, icon_map)
+    for size, icon_map in sorted(bucket_by_size(light_map).items()):
+        add_variant("Light", size, light_path, light_family, icon_map)
 
     resizable_regular_map = {name: cp for (name, _), cp in resizable_regular.items()}
     resizable_filled_map = {name: cp for (name, _), cp in resizable_filled.items()}
@@ -421,8 +503,8 @@ def generate_fluentui() -> Tuple[List[dict], List[dict]]:
             "id": "regular",
             "style": "Regular",
             "size": "Regular",
-            "family": load_family(resizable_path),
-            "ttf_asset_path": str(resizable_path).replace("\\", "/"),
+            "family": resizable_family,
+            "ttf_asset_path": resizable_path.as_posix(),
         }
     )
     variant_maps["regular"] = resizable_regular_map
@@ -431,8 +513,8 @@ def generate_fluentui() -> Tuple[List[dict], List[dict]]:
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
-            "family": load_family(resizable_path),
-            "ttf_asset_path": str(resizable_path).replace("\\", "/"),
+            "family": resizable_family,
+            "ttf_asset_path": resizable_path.as_posix(),
         }
     )
     variant_maps["filled"] = resizable_filled_map
@@ -452,14 +534,14 @@ def generate_iconoir() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(filled_path),
-            "ttf_asset_path": str(filled_path).replace("\\", "/"),
+            "ttf_asset_path": filled_path.as_posix(),
         },
     ]
     icons = merge_variants(variants, {"regular": regular_map, "filled": filled_map}, "regular")
@@ -479,21 +561,21 @@ def generate_ionicons() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "outline",
             "style": "Outline",
             "size": "Regular",
             "family": load_family(outline_path),
-            "ttf_asset_path": str(outline_path).replace("\\", "/"),
+            "ttf_asset_path": outline_path.as_posix(),
         },
         {
             "id": "sharp",
             "style": "Sharp",
             "size": "Regular",
             "family": load_family(sharp_path),
-            "ttf_asset_path": str(sharp_path).replace("\\", "/"),
+            "ttf_asset_path": sharp_path.as_posix(),
         },
     ]
     icons = merge_variants(
@@ -513,7 +595,7 @@ def generate_lobe() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         }
     ]
     icons = merge_variants(variants, {"regular": icon_map}, "regular")
@@ -529,7 +611,7 @@ def generate_lucide() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         }
     ]
     icons = merge_variants(variants, {"regular": icon_map}, "regular")
@@ -544,7 +626,7 @@ def generate_octicons() -> Tuple[List[dict], List[dict]]:
         regular: Dict[str, int] = {}
         filled: Dict[str, int] = {}
         for name, cp in load_cmap(path).items():
-            match = re.match(r"^(?P<base>.+?)(?P<fill>-fill)?-(?P<size>\d+)$", name)
+            match = OCTICONS_NAME_PATTERN.match(name)
             if not match:
                 continue
             if int(match.group("size")) != size_filter:
@@ -565,21 +647,21 @@ def generate_octicons() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "tiny",
             "style": "Regular",
             "size": "Tiny",
             "family": load_family(tiny_path),
-            "ttf_asset_path": str(tiny_path).replace("\\", "/"),
+            "ttf_asset_path": tiny_path.as_posix(),
             "feature": "octicons-tiny",
         },
         {
@@ -587,7 +669,7 @@ def generate_octicons() -> Tuple[List[dict], List[dict]]:
             "style": "Filled",
             "size": "Tiny",
             "family": load_family(tiny_path),
-            "ttf_asset_path": str(tiny_path).replace("\\", "/"),
+            "ttf_asset_path": tiny_path.as_posix(),
             "feature": "octicons-tiny",
         },
     ]
@@ -625,7 +707,7 @@ def generate_phosphor() -> Tuple[List[dict], List[dict]]:
                 "style": style_name,
                 "size": "Regular",
                 "family": load_family(ttf),
-                "ttf_asset_path": str(ttf).replace("\\", "/"),
+                "ttf_asset_path": ttf.as_posix(),
             }
         )
         variant_maps[style_id] = icon_map
@@ -642,14 +724,14 @@ def generate_remixicon() -> Tuple[List[dict], List[dict]]:
             "style": "Outline",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         },
     ]
     icons = merge_variants(variants, {"outline": outline, "filled": filled}, "outline")
@@ -667,14 +749,14 @@ def generate_tabler() -> Tuple[List[dict], List[dict]]:
             "style": "Regular",
             "size": "Regular",
             "family": load_family(regular_path),
-            "ttf_asset_path": str(regular_path).replace("\\", "/"),
+            "ttf_asset_path": regular_path.as_posix(),
         },
         {
             "id": "filled",
             "style": "Filled",
             "size": "Regular",
             "family": load_family(filled_path),
-            "ttf_asset_path": str(filled_path).replace("\\", "/"),
+            "ttf_asset_path": filled_path.as_posix(),
         },
     ]
     icons = merge_variants(variants, {"regular": regular_map, "filled": filled_map}, "regular")
@@ -690,34 +772,46 @@ def generate_simple(pack_id: str, filename: str) -> Tuple[List[dict], List[dict]
             "style": "Regular",
             "size": "Regular",
             "family": load_family(ttf),
-            "ttf_asset_path": str(ttf).replace("\\", "/"),
+            "ttf_asset_path": ttf.as_posix(),
         }
     ]
     icons = merge_variants(variants, {"regular": icon_map}, "regular")
     return variants, icons
 
 
-def main() -> int:
-    generators = {
-        "bootstrap": generate_bootstrap,
-        "heroicons": generate_heroicons,
-        "carbon": generate_carbon,
-        "devicon": generate_devicon,
-        "feather": generate_feather,
-        "fluentui": generate_fluentui,
-        "iconoir": generate_iconoir,
-        "ionicons": generate_ionicons,
-        "lobe": generate_lobe,
-        "lucide": generate_lucide,
-        "octicons": generate_octicons,
-        "phosphor": generate_phosphor,
-        "remixicon": generate_remixicon,
-        "tabler": generate_tabler,
-    }
+GENERATORS = {
+    "bootstrap": generate_bootstrap,
+    "heroicons": generate_heroicons,
+    "carbon": generate_carbon,
+    "devicon": generate_devicon,
+    "feather": generate_feather,
+    "fluentui": generate_fluentui,
+    "iconoir": generate_iconoir,
+    "ionicons": generate_ionicons,
+    "lobe": generate_lobe,
+    "lucide": generate_lucide,
+    "octicons": generate_octicons,
+    "phosphor": generate_phosphor,
+    "remixicon": generate_remixicon,
+    "tabler": generate_tabler,
+}
+
 
-    for pack_id, gen in generators.items():
-        variants, icons = gen()
-        write_map(pack_id, variants, icons)
+def _run_pack(pack_id: str) -> str:
+    # Each worker process keeps its own _open_font cache.
+    variants, icons = GENERATORS[pack_id]()
+    write_map(pack_id, variants, icons)
+    _open_font.cache_clear()
+    load_family.cache_clear()
+    return pack_id
+
+
+def main() -> int:
+    # Packs are independent, so generate them in parallel processes.
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_run_pack, pack_id) for pack_id in GENERATORS]
+        for future in futures:
+            future.result()
 
     return 0
 
@@ -18,6 +18,9 @@
 
 from __future__ import annotations
 
+import errno
+import os
+import shutil
 from pathlib import Path
 
 
@@ -33,15 +36,13 @@ def main() -> int:
         print(f"Каталог с иконками не найден: {icons_dir}")
         return 1
 
-    # Ищем все файлы, заканчивающиеся на '16' перед расширением
-    targets = []
-    for path in icons_dir.glob("*.svg"):
-        if not path.is_file():
-            continue
-        # Проверяем, что имя заканчивается на '16' перед расширением
-        stem = path.stem
-        if stem.endswith("16"):
-            targets.append(path)
+    # Ищем все файлы, заканчивающиеся на '16' перед расширением.
+    with os.scandir(icons_dir) as it:
+        targets = [
+            entry.name
+            for entry in it
+            if entry.name.endswith("16.svg") and entry.is_file(follow_symlinks=False)
+        ]
 
     if not targets:
         print(f"В {icons_dir} не найдено иконок, заканчивающихся на '16'.")
@@ -51,14 +52,25 @@ def main() -> int:
     target_dir = icons_dir / TARGET_SUBDIR
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    print(f"Найдено {len(targets)} иконок, заканчивающихся на '16', перемещаем в {target_dir.relative_to(root)}:\n")
-    for path in sorted(targets):
-        dest = target_dir / path.name
-        print(f"  {path.name} -> {dest.relative_to(root)}")
+    target_rel = target_dir.relative_to(root)
+    print(f"Найдено {len(targets)} иконок, заканчивающихся на '16', перемещаем в {target_rel}:\n")
+    report = []
+    for name in sorted(targets):
+        report.append(f"  {name} -> {target_rel / name}")
+        src = icons_dir / name
+        dest = target_dir / name
         try:
-            path.rename(dest)
+            os.rename(src, dest)
         except OSError as exc:  # noqa: BLE001
-            print(f"    ! ошибка перемещения: {exc}")
+            if exc.errno != errno.EXDEV:
+                report.append(f"    ! ошибка перемещения: {exc}")
+                continue
+            # Подпапка на другом томе (например, смонтирована отдельно): копируем.
+            try:
+                shutil.move(src, dest)
+            except OSError as move_exc:  # noqa: BLE001
+                report.append(f"    ! ошибка перемещения: {move_exc}")
+    print("\n".join(report))
 
     print("\nГотово.")
     return 0
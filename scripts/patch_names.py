@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 
 from fontTools.ttLib import TTFont
@@ -70,7 +73,15 @@ def patch_font(path: Path, family: str) -> None:
     if not path.exists():
         raise FileNotFoundError(f"TTF not found: {path}")
 
-    font = TTFont(path)
+    # Load from memory: a lazy font reads from its source file on save, and we
+    # overwrite that same file. Only `name` is decompiled; every other table
+    # is written back verbatim.
+    font = TTFont(
+        BytesIO(path.read_bytes()),
+        lazy=True,
+        recalcBBoxes=False,
+        recalcTimestamp=False,
+    )
     name_table = font["name"]
 
     postscript = build_postscript_name(family)
@@ -83,7 +94,14 @@ def patch_font(path: Path, family: str) -> None:
     set_name(name_table, 16, family)  # Preferred Family
     set_name(name_table, 17, subfamily)  # Preferred Subfamily
 
-    font.save(path)
+    # TTFont.save(path) would probe `reader.file.name`, which BytesIO lacks.
+    buffer = BytesIO()
+    font.save(buffer)
+    path.write_bytes(buffer.getvalue())
+
+
+def _patch_worker(target: PatchTarget) -> None:
+    patch_font(target.path, target.family)
 
 
 def parse_targets_file(path: Path) -> list[PatchTarget]:
@@ -139,13 +157,15 @@ def collect_default_targets() -> list[PatchTarget]:
     targets: list[PatchTarget] = []
     if not ASSETS_FONTS_DIR.exists():
         raise FileNotFoundError(f"Assets fonts directory not found: {ASSETS_FONTS_DIR}")
-    for pack_dir in sorted(ASSETS_FONTS_DIR.iterdir()):
-        if not pack_dir.is_dir():
-            continue
+    with os.scandir(ASSETS_FONTS_DIR) as it:
+        pack_dirs = sorted((entry for entry in it if entry.is_dir()), key=lambda entry: entry.name)
+    for pack_dir in pack_dirs:
         pack_id = pack_dir.name
-        for ttf in sorted(pack_dir.glob("*.ttf")):
-            family = infer_family(pack_id, ttf.stem)
-            targets.append(PatchTarget(ttf, family))
+        with os.scandir(pack_dir.path) as it:
+            ttf_names = sorted(entry.name for entry in it if entry.name.endswith(".ttf") and entry.is_file())
+        for name in ttf_names:
+            family = infer_family(pack_id, name[:-4])
+            targets.append(PatchTarget(ASSETS_FONTS_DIR / pack_id / name, family))
     return targets
 
 
@@ -159,7 +179,15 @@ def main(argv: list[str] | None = None) -> int:
         action="store_true",
         help="Patch built-in heroicons/bootstrap targets",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to CPU count)",
+    )
     args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     targets: list[PatchTarget] = []
     if args.apply_defaults:
@@ -174,8 +202,16 @@ def main(argv: list[str] | None = None) -> int:
     if not targets:
         raise ValueError("No targets provided. Use --apply-defaults or --file/--family.")
 
-    for target in targets:
-        patch_font(target.path, target.family)
+    # A path listed twice would race in parallel; patching is last-wins anyway.
+    unique_targets = list({target.path.resolve(): target for target in targets}.values())
+    if len(unique_targets) == 1 or args.jobs == 1:
+        for target in unique_targets:
+            patch_font(target.path, target.family)
+    else:
+        # Each font is loaded, patched and saved independently.
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for _ in executor.map(_patch_worker, unique_targets):
+                pass
 
     return 0
 
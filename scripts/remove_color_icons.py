@@ -15,6 +15,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -29,19 +30,27 @@ def main() -> int:
         print(f"Каталог с иконками не найден: {icons_dir}")
         return 1
 
-    targets = sorted(p for p in icons_dir.glob("*color*.svg") if p.is_file())
+    # Один проход scandir: подстрока + суффикс вместо fnmatch-шаблона,
+    # тип файла берётся из закэшированного DirEntry.
+    with os.scandir(icons_dir) as it:
+        targets = sorted(
+            (entry for entry in it if entry.name.endswith(".svg") and "color" in entry.name and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
 
     if not targets:
         print(f"В {icons_dir} не найдено иконок с 'color' в имени.")
         return 0
 
     print(f"Найдено {len(targets)} иконок с 'color' в имени, удаляем:\n")
-    for path in targets:
-        print(f"  удаляю {path.name}")
+    report = []
+    for entry in targets:
+        report.append(f"  удаляю {entry.name}")
         try:
-            path.unlink()
+            os.unlink(entry.path)
         except OSError as exc:  # noqa: BLE001
-            print(f"    ! ошибка удаления: {exc}")
+            report.append(f"    ! ошибка удаления: {exc}")
+    print("\n".join(report))
 
     print("\nГотово.")
     return 0
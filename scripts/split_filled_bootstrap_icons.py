@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -29,14 +30,15 @@ def main() -> int:
         print(f"Каталог с иконками не найден: {icons_dir}")
         return 1
 
-    svg_files = sorted(p for p in icons_dir.glob("*.svg") if p.is_file())
+    with os.scandir(icons_dir) as it:
+        svg_files = sorted(entry.name for entry in it if entry.name.endswith(".svg") and entry.is_file())
     if not svg_files:
         print(f"В {icons_dir} нет *.svg")
         return 0
 
     # Перемещаем ТОЛЬКО иконки, у которых имя заканчивается на '-fill.svg'
     # (например, '2-square-fill.svg'), остальные остаются на месте.
-    targets = [p for p in svg_files if p.stem.endswith("-fill")]
+    targets = [name for name in svg_files if name.endswith("-fill.svg")]
 
     if not targets:
         print(f"В {icons_dir} не найдено SVG с атрибутом fill.")
@@ -45,16 +47,18 @@ def main() -> int:
     target_dir = icons_dir / TARGET_SUBDIR
     target_dir.mkdir(parents=True, exist_ok=True)
 
+    target_rel = target_dir.relative_to(root)
     print(
         f"Найдено {len(targets)} SVG с 'fill', перемещаем в "
-        f"{target_dir.relative_to(root)}:\n"
+        f"{target_rel}:\n"
     )
 
-    for path in targets:
-        dest = target_dir / path.name
-        print(f"  {path.name} -> {dest.relative_to(root)}")
+    src_dir = os.fspath(icons_dir)
+    dest_dir = os.fspath(target_dir)
+    for name in targets:
+        print(f"  {name} -> {target_rel / name}")
         try:
-            path.rename(dest)
+            os.rename(os.path.join(src_dir, name), os.path.join(dest_dir, name))
         except OSError as exc:  # noqa: BLE001
             print(f"    ! ошибка перемещения: {exc}")
 
@@ -24,28 +24,28 @@
 from __future__ import annotations
 
 import argparse
+import os
 from pathlib import Path
 
 
+# Маркеры в порядке приоритета: первый найденный в имени определяет стиль.
+# Проверки вида endswith("-outline") покрываются подстрокой "outline",
+# а "filled" — подстрокой "fill", поэтому отдельно не нужны.
+STYLE_MARKERS = (
+    ("outline", "outline"),
+    ("sharp", "sharp"),
+    ("solid", "solid"),
+    ("glyph", "glyph"),
+    ("fill", "filled"),
+)
+
+
 def detect_style(stem: str) -> str:
     """Определяет стиль иконки по имени файла."""
     lower = stem.lower()
-
-    if lower.endswith("-outlined") or lower.endswith("-outline") or "outline" in lower:
-        return "outline"
-    if lower.endswith("-sharp") or "sharp" in lower:
-        return "sharp"
-    if lower.endswith("-solid") or "solid" in lower:
-        return "solid"
-    if lower.endswith("-glyph") or "glyph" in lower:
-        return "glyph"
-    if (
-        lower.endswith("-filled")
-        or lower.endswith("-fill")
-        or "filled" in lower
-        or "fill" in lower
-    ):
-        return "filled"
+    for marker, style in STYLE_MARKERS:
+        if marker in lower:
+            return style
     return "regular"
 
 
@@ -66,22 +66,20 @@ def main(argv: list[str] | None = None) -> int:
         print(f"Каталог с иконками не найден: {icons_dir}")
         return 1
 
-    svg_files = sorted(p for p in icons_dir.glob("*.svg") if p.is_file())
+    with os.scandir(icons_dir) as it:
+        svg_files = sorted(entry.name for entry in it if entry.name.endswith(".svg") and entry.is_file())
     if not svg_files:
         print(f"В {icons_dir} нет *.svg")
         return 0
 
     # Подготовка каталога назначения
+    src_dir = os.fspath(icons_dir)
     out_dirs = {
-        "outline": icons_dir / "outline",
-        "sharp": icons_dir / "sharp",
-        "solid": icons_dir / "solid",
-        "filled": icons_dir / "filled",
-        "glyph": icons_dir / "glyph",
-        "regular": icons_dir / "regular",
+        style: os.path.join(src_dir, style)
+        for style in ("outline", "sharp", "solid", "filled", "glyph", "regular")
     }
     for d in out_dirs.values():
-        d.mkdir(parents=True, exist_ok=True)
+        os.makedirs(d, exist_ok=True)
 
     moved_counts = {key: 0 for key in out_dirs.keys()}
 
@@ -90,21 +88,17 @@ def main(argv: list[str] | None = None) -> int:
         f"outline/sharp/solid/filled/glyph/regular внутри {icons_dir}...\n"
     )
 
-    for path in svg_files:
-        style = detect_style(path.stem)
-        dest_dir = out_dirs[style]
-        dest = dest_dir / path.name
-
-        # Если файл уже в нужной подпапке, пропускаем
-        if path.parent == dest_dir:
-            continue
-
-        print(f"  {path.name} -> {style}/{path.name}")
+    report = []
+    for name in svg_files:
+        style = detect_style(name[:-4])
+        report.append(f"  {name} -> {style}/{name}")
         try:
-            path.rename(dest)
+            os.rename(os.path.join(src_dir, name), os.path.join(out_dirs[style], name))
             moved_counts[style] += 1
         except OSError as exc:  # noqa: BLE001
-            print(f"    ! ошибка перемещения: {exc}")
+            report.append(f"    ! ошибка перемещения: {exc}")
+    if report:
+        print("\n".join(report))
 
     print("\nИтог:")
     for style, count in moved_counts.items():
@@ -9,85 +9,121 @@ each icon is represented as a constant containing SVG path data.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
-import xml.etree.ElementTree as ET
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+try:
+    from lxml import etree as ET
 
+    # One parser instance reused for every icon; libxml2 builds the tree in C.
+    _XML_PARSER = ET.XMLParser(remove_comments=True, remove_pis=True)
+except ImportError:  # pragma: no cover
+    import xml.etree.ElementTree as ET
+
+    _XML_PARSER = None
+
+
+SVG_NS = "http://www.w3.org/2000/svg"
+NAME_SEPARATOR_PATTERN = re.compile(r"[-_\s]+")
+NON_KEBAB_PATTERN = re.compile(r"[^a-z0-9-]+")
+DASH_RUN_PATTERN = re.compile(r"-{2,}")
+XML_DECLARATION_PATTERN = re.compile(r"<\?xml[^>]*\?>")
+RUST_ESCAPES = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n"})
+SHAPE_TAGS = {
+    f"{{{SVG_NS}}}{name}": name
+    for name in ("path", "polyline", "polygon", "circle", "rect", "line")
+}
+
+
+@lru_cache(maxsize=4096)
 def normalize_rust_name(name: str) -> str:
     """Convert icon name to Rust identifier (PascalCase)."""
     # Remove file extension
     name = name.rsplit(".", 1)[0] if "." in name else name
     # Split by common separators
-    parts = re.split(r"[-_\s]+", name)
+    parts = NAME_SEPARATOR_PATTERN.split(name)
     # Convert to PascalCase
     return "".join(word.capitalize() for word in parts if word)
 
 
+@lru_cache(maxsize=4096)
 def normalize_kebab(name: str) -> str:
     """Normalize icon name to kebab-case."""
     cleaned = name.strip().lower().replace("_", "-")
-    cleaned = re.sub(r"[^a-z0-9-]+", "-", cleaned)
-    cleaned = re.sub(r"-{2,}", "-", cleaned)
+    cleaned = NON_KEBAB_PATTERN.sub("-", cleaned)
+    cleaned = DASH_RUN_PATTERN.sub("-", cleaned)
     cleaned = cleaned.strip("-")
     return cleaned
 
 
+def points_to_path(points: str) -> str:
+    """
+    Convert a points attribute to path data.
+    Format: "x1,y1 x2,y2 ..." -> "M x1,y1 L x2,y2 ..."; a trailing odd
+    coordinate is dropped. Returns "" when there is no complete point.
+    """
+    coords = points.replace(",", " ").split()
+    if len(coords) < 2:
+        return ""
+    # zip of two strides pairs coordinates without index arithmetic
+    pairs = zip(coords[0::2], coords[1::2])
+    x, y = next(pairs)
+    return " ".join([f"M {x},{y}", *(f"L {x},{y}" for x, y in pairs)])
+
+
 def extract_svg_paths(svg_content: str) -> List[str]:
     """
     Extract all path data from SVG content.
     Returns list of path 'd' attribute values and other shape data.
     """
     try:
-        root = ET.fromstring(svg_content)
+        root = ET.fromstring(svg_content, _XML_PARSER)
     except ET.ParseError as e:
         raise ValueError(f"Failed to parse SVG: {e}") from e
 
-    # Register namespaces
-    namespaces = {
-        "svg": "http://www.w3.org/2000/svg",
-        "": "http://www.w3.org/2000/svg",
-    }
+    # One walk over the descendants buckets every shape by kind; each bucket
+    # keeps document order, and kinds are emitted in the fixed order below.
+    shapes: Dict[str, list] = {name: [] for name in SHAPE_TAGS.values()}
+    for child in root:
+        for elem in child.iter():
+            name = SHAPE_TAGS.get(elem.tag)
+            if name is not None:
+                shapes[name].append(elem)
 
     paths = []
     
     # Find all path elements
-    for path in root.findall(".//path", namespaces):
+    for path in shapes["path"]:
         d_attr = path.get("d")
         if d_attr:
             paths.append(d_attr)
     
     # Handle polyline elements - convert points to path-like format
-    for polyline in root.findall(".//polyline", namespaces):
+    for polyline in shapes["polyline"]:
         points = polyline.get("points")
         if points:
-            # Convert polyline points to path data format
-            # Format: "x1,y1 x2,y2 ..." -> "M x1,y1 L x2,y2 ..."
-            coords = points.strip().replace(",", " ").split()
-            if len(coords) >= 2:
-                path_data = f"M {coords[0]},{coords[1]}"
-                for i in range(2, len(coords), 2):
-                    if i + 1 < len(coords):
-                        path_data += f" L {coords[i]},{coords[i+1]}"
+            path_data = points_to_path(points)
+            if path_data:
                 paths.append(path_data)
     
     # Handle polygon elements - similar to polyline but closed
-    for polygon in root.findall(".//polygon", namespaces):
+    for polygon in shapes["polygon"]:
         points = polygon.get("points")
         if points:
-            coords = points.strip().replace(",", " ").split()
-            if len(coords) >= 2:
-                path_data = f"M {coords[0]},{coords[1]}"
-                for i in range(2, len(coords), 2):
-                    if i + 1 < len(coords):
-                        path_data += f" L {coords[i]},{coords[i+1]}"
-                path_data += " Z"  # Close the path
-                paths.append(path_data)
+            path_data = points_to_path(points)
+            if path_data:
+                paths.append(f"{path_data} Z")  # Close the path
     
     # Handle circle elements
-    for circle in root.findall(".//circle", namespaces):
+    for circle in shapes["circle"]:
         cx = circle.get("cx", "0")
         cy = circle.get("cy", "0")
         r = circle.get("r", "0")
@@ -96,7 +132,7 @@ def extract_svg_paths(svg_content: str) -> List[str]:
         paths.append(path_data)
     
     # Handle rect elements
-    for rect in root.findall(".//rect", namespaces):
+    for rect in shapes["rect"]:
         x = rect.get("x", "0")
         y = rect.get("y", "0")
         width = rect.get("width", "0")
@@ -113,7 +149,7 @@ def extract_svg_paths(svg_content: str) -> List[str]:
         paths.append(path_data)
     
     # Handle line elements
-    for line in root.findall(".//line", namespaces):
+    for line in shapes["line"]:
         x1 = line.get("x1", "0")
         y1 = line.get("y1", "0")
         x2 = line.get("x2", "0")
@@ -126,10 +162,15 @@ def extract_svg_paths(svg_content: str) -> List[str]:
 
 def extract_svg_content(svg_path: Path) -> str:
     """Extract SVG content, handling different SVG formats."""
-    content = svg_path.read_text(encoding="utf-8")
+    # Plain binary read + one decode: XML parsers normalise line endings
+    # themselves, so text-mode newline translation is wasted work here.
+    with open(svg_path, "rb") as f:
+        content = f.read().decode("utf-8")
     
-    # Remove XML declaration if present
-    content = re.sub(r'<\?xml[^>]*\?>', '', content)
+    # Remove XML declaration if present (most icon files have none,
+    # so skip the regex pass entirely for them)
+    if "<?xml" in content:
+        content = XML_DECLARATION_PATTERN.sub("", content)
     
     # Extract viewBox and other attributes if needed
     return content.strip()
@@ -152,24 +193,54 @@ def extract_path_data(svg_path: Path) -> Tuple[str, List[str]]:
 
 def escape_rust_string(s: str) -> str:
     """Escape string for Rust string literal."""
-    return s.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return s.translate(RUST_ESCAPES)
 
 
-def generate_rust_constant(icon_name: str, rust_name: str, paths: List[str]) -> str:
+def generate_rust_constant(
+    icon_name: str,
+    rust_name: str,
+    paths: List[str],
+    shared_paths: Optional[Dict[str, str]] = None,
+) -> str:
     """Generate Rust constant for an icon."""
+    # XML cannot carry NUL characters, so NUL safely separates the paths:
+    # all of them are escaped in one pass, then split into quoted literals.
+    escaped = escape_rust_string("\0".join(paths)).split("\0")
+    # Paths shared with other icons refer to their interned constant.
+    shared_paths = shared_paths or {}
+    items = [
+        shared_paths.get(path) or f'"{literal}"'
+        for path, literal in zip(paths, escaped)
+    ]
     if len(paths) == 1:
         # Single path - simple constant
-        path_data = escape_rust_string(paths[0])
-        return f'pub const {rust_name}: &str = "{path_data}";'
+        return f"pub const {rust_name}: &str = {items[0]};"
     else:
         # Multiple paths - array constant
-        path_strings = [escape_rust_string(p) for p in paths]
-        paths_str = ",\n        ".join(f'"{p}"' for p in path_strings)
+        items_str = ",\n        ".join(items)
         return f"""pub const {rust_name}: &[&str] = &[
-        {paths_str}
+        {items_str}
     ];"""
 
 
+def intern_shared_paths(
+    icons: Dict[str, Tuple[str, List[str]]],
+) -> Dict[str, str]:
+    """Name every path that occurs more than once across the pack.
+
+    Returns a dict mapping path -> constant name, numbered in first-use
+    order over the name-sorted icons.
+    """
+    counts = Counter(path for _, paths in icons.values() for path in paths)
+    shared_paths: Dict[str, str] = {}
+    for _, (_, paths) in sorted(icons.items()):
+        for path in paths:
+            if counts[path] > 1 and path not in shared_paths:
+                # Icon identifiers never contain "_", so these cannot clash.
+                shared_paths[path] = f"_PATH_{len(shared_paths)}"
+    return shared_paths
+
+
 def generate_rust_file(
     pack_name: str,
     icons: Dict[str, Tuple[str, List[str]]],
@@ -185,62 +256,134 @@ def generate_rust_file(
     """
     rust_module_name = pack_name.lower().replace("-", "_")
     
-    lines = [
-        "// @generated by scripts/svg_to_rust.py. DO NOT EDIT.",
-        "",
-        f"// Icon pack: {pack_name}",
-        f"// Total icons: {len(icons)}",
-        "",
+    # Every chunk carries its own trailing newline; the file is one join.
+    parts = [
+        "// @generated by scripts/svg_to_rust.py. DO NOT EDIT.\n"
+        "\n"
+        f"// Icon pack: {pack_name}\n"
+        f"// Total icons: {len(icons)}\n"
+        "\n"
     ]
     
-    # Generate constants for each icon
-    sorted_icons = sorted(icons.items(), key=lambda x: x[0])
-    
-    for icon_name, (rust_name, paths) in sorted_icons:
-        lines.append(generate_rust_constant(icon_name, rust_name, paths))
-        lines.append("")
-    
-    # Generate helper functions/structs if needed
-    lines.extend([
-        "",
-        "/// Get SVG path data for an icon by name (kebab-case).",
-        "pub fn get_icon_path(name: &str) -> Option<&'static [&'static str]> {",
-        "    match name {",
-    ])
+    # Identical paths (often shared between variants of an icon) are emitted
+    # once as private constants and referenced from each icon.
+    shared_paths = intern_shared_paths(icons)
+    for path, const_name in shared_paths.items():
+        parts.append(f'const {const_name}: &str = "{escape_rust_string(path)}";\n')
+    if shared_paths:
+        parts.append("\n")
     
-    for icon_name, (rust_name, paths) in sorted_icons:
+    # One pass over the sorted icons fills all three sections; names are
+    # unique dict keys, so sorting the items sorts by name.
+    constants: List[str] = []
+    lookup_entries: List[str] = []
+    icon_names: List[str] = []
+    for icon_name, (rust_name, paths) in sorted(icons.items()):
+        constants.append(f"{generate_rust_constant(icon_name, rust_name, paths, shared_paths)}\n\n")
         if len(paths) == 1:
-            lines.append(f'        "{icon_name}" => Some(&[{rust_name}]),')
+            lookup_entries.append(f'    ("{icon_name}", &[{rust_name}]),\n')
         else:
-            lines.append(f'        "{icon_name}" => Some({rust_name}),')
+            lookup_entries.append(f'    ("{icon_name}", {rust_name}),\n')
+        icon_names.append(f'    "{icon_name}",\n')
     
-    lines.extend([
-        "        _ => None,",
-        "    }",
-        "}",
-        "",
-        "/// List all available icon names.",
-        "pub const ICON_NAMES: &[&str] = &[",
-    ])
+    parts.extend(constants)
     
-    for icon_name, _ in sorted_icons:
-        lines.append(f'    "{icon_name}",')
-    
-    lines.extend([
-        "];",
-        "",
-    ])
+    # Lookup goes through a name-sorted table and a binary search instead of
+    # a `match` with one arm per icon. Python sorts str by code point, which
+    # agrees with Rust's byte-wise `str` ordering for UTF-8.
+    parts.append(
+        "\n"
+        "const ICONS_SORTED: &[(&str, &[&str])] = &[\n"
+    )
+    parts.extend(lookup_entries)
+    parts.append(
+        "];\n"
+        "\n"
+        "/// Get SVG path data for an icon by name (kebab-case).\n"
+        "pub fn get_icon_path(name: &str) -> Option<&'static [&'static str]> {\n"
+        "    ICONS_SORTED\n"
+        "        .binary_search_by_key(&name, |&(icon_name, _)| icon_name)\n"
+        "        .ok()\n"
+        "        .map(|index| ICONS_SORTED[index].1)\n"
+        "}\n"
+        "\n"
+        "/// List all available icon names.\n"
+        "pub const ICON_NAMES: &[&str] = &[\n"
+    )
+    parts.extend(icon_names)
+    parts.append("];\n")
     
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text("\n".join(lines), encoding="utf-8")
+    # .gitattributes pins *.rs to LF
+    output_path.write_text("".join(parts), encoding="utf-8", newline="\n")
     print(f"Generated {output_path} with {len(icons)} icons")
 
 
+def _collect_icon(
+    icons: Dict[str, Tuple[str, List[str]]],
+    errors: List[str],
+    svg_file: Path,
+    parsed: Optional[Tuple[str, str, List[str]]],
+    error: Optional[str],
+) -> None:
+    if parsed is None:
+        errors.append(error)
+        return
+    icon_name, rust_name, paths = parsed
+    if icon_name in icons:
+        print(f"Warning: Duplicate icon name '{icon_name}' from {svg_file}", file=sys.stderr)
+        return
+    icons[icon_name] = (rust_name, paths)
+
+
+def parse_svg_file(svg_file: Path) -> Tuple[Optional[Tuple[str, str, List[str]]], Optional[str]]:
+    """
+    Parse one SVG file in a worker process.
+    Returns ((icon_name, rust_name, paths), None) or (None, error_message).
+    """
+    try:
+        icon_name, paths = extract_path_data(svg_file)
+        return (icon_name, normalize_rust_name(svg_file.stem), paths), None
+    except Exception as e:
+        return None, f"{svg_file}: {e}"
+
+
+def parse_cache_path(output_path: Path) -> Path:
+    return output_path.with_suffix(".cache.json")
+
+
+def _script_digest() -> str:
+    """Hash of this script, so any change to parsing logic drops old caches."""
+    return hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def load_parse_cache(cache_path: Path) -> Dict[str, list]:
+    """
+    Load cached parse results.
+    Maps absolute SVG path -> [mtime_ns, size, icon_name, rust_name, paths].
+    """
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _script_digest():
+        return {}
+    return data.get("files", {})
+
+
+def save_parse_cache(cache_path: Path, files: Dict[str, list]) -> None:
+    payload = {"version": _script_digest(), "files": files}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
 def process_svg_directory(
     svg_dir: Path,
     pack_name: str,
     output_path: Path,
     pattern: str = "*.svg",
+    jobs: Optional[int] = None,
+    use_cache: bool = True,
 ) -> None:
     """
     Process directory of SVG files and generate Rust code.
@@ -250,6 +393,8 @@ def process_svg_directory(
         pack_name: Name of the icon pack
         output_path: Path to output Rust file
         pattern: Glob pattern for SVG files (default: "*.svg")
+        jobs: Number of worker processes (default: CPU count, 1 = serial)
+        use_cache: Reuse/refresh parse results in <output>.cache.json
     """
     if not svg_dir.is_dir():
         raise ValueError(f"Not a directory: {svg_dir}")
@@ -259,21 +404,53 @@ def process_svg_directory(
     if not svg_files:
         raise ValueError(f"No SVG files found in {svg_dir} matching pattern {pattern}")
     
-    icons: Dict[str, Tuple[str, List[str]]] = {}
-    errors: List[str] = []
+    cache_path = parse_cache_path(output_path)
+    cached = load_parse_cache(cache_path) if use_cache else {}
+    fresh_cache: Dict[str, list] = {}
     
-    for svg_file in svg_files:
+    # Unchanged files (same mtime and size) reuse the cached parse result;
+    # only the rest are sent to the parser.
+    results: List[Tuple[Optional[Tuple[str, str, List[str]]], Optional[str]]] = [(None, None)] * len(svg_files)
+    pending: List[int] = []
+    keys: List[str] = []
+    for index, svg_file in enumerate(svg_files):
+        key = os.path.abspath(svg_file)
+        keys.append(key)
         try:
-            icon_name, paths = extract_path_data(svg_file)
-            rust_name = normalize_rust_name(svg_file.stem)
-            
-            if icon_name in icons:
-                print(f"Warning: Duplicate icon name '{icon_name}' from {svg_file}", file=sys.stderr)
-                continue
-            
-            icons[icon_name] = (rust_name, paths)
-        except Exception as e:
-            errors.append(f"{svg_file}: {e}")
+            st = os.stat(svg_file)
+        except OSError:
+            # Let the parser report it like any other unreadable file.
+            pending.append(index)
+            continue
+        entry = cached.get(key)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            results[index] = ((entry[2], entry[3], entry[4]), None)
+            fresh_cache[key] = entry
+        else:
+            pending.append(index)
+            fresh_cache[key] = [st.st_mtime_ns, st.st_size]
+    
+    # Files are parsed independently; results come back in input order,
+    # so duplicate detection below sees them exactly as a serial loop would.
+    pending_files = [svg_files[index] for index in pending]
+    if jobs == 1 or len(pending_files) <= 1:
+        parsed_results = list(map(parse_svg_file, pending_files))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            parsed_results = list(executor.map(parse_svg_file, pending_files, chunksize=32))
+    for index, result in zip(pending, parsed_results):
+        results[index] = result
+        parsed = result[0]
+        if parsed is None:
+            # Failures are not cached so they are reported on every run.
+            fresh_cache.pop(keys[index], None)
+        elif keys[index] in fresh_cache:
+            fresh_cache[keys[index]].extend(parsed)
+    
+    icons: Dict[str, Tuple[str, List[str]]] = {}
+    errors: List[str] = []
+    for svg_file, (parsed, error) in zip(svg_files, results):
+        _collect_icon(icons, errors, svg_file, parsed, error)
     
     if errors:
         print("Errors encountered:", file=sys.stderr)
@@ -283,6 +460,8 @@ def process_svg_directory(
             raise ValueError("No valid icons found")
     
     generate_rust_file(pack_name, icons, output_path)
+    if use_cache:
+        save_parse_cache(cache_path, fresh_cache)
 
 
 def main() -> int:
@@ -310,8 +489,21 @@ def main() -> int:
         default="*.svg",
         help="Glob pattern for SVG files (default: *.svg)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Neither read nor update the <output>.cache.json parse cache",
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count, 1 = serial)",
+    )
     
     args = parser.parse_args()
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
     
     try:
         process_svg_directory(
@@ -319,6 +511,8 @@ def main() -> int:
             args.name,
             args.output,
             args.pattern,
+            args.jobs,
+            use_cache=not args.no_cache,
         )
         return 0
     except Exception as e:
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 from fontTools.ttLib import TTFont
 
@@ -12,6 +17,30 @@ try:
 except ImportError as exc:  # pragma: no cover
     raise SystemExit("Missing dependency: jsonschema. Install with `python -m pip install jsonschema`.") from exc
 
+try:
+    import tomllib
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Optional compiled validators; jsonschema stays the reference and fallback.
+try:
+    import jsonschema_rs
+except ImportError:  # pragma: no cover
+    jsonschema_rs = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover
+    fastjsonschema = None
+
 
 SCHEMA_PATH = Path("assets/schema/iconflow-pack.schema.json")
 MAPS_DIR = Path("assets/maps")
@@ -20,67 +49,87 @@ SURROGATE_MAX = 0xDFFF
 CARGO_TOML = Path("Cargo.toml")
 
 
+def read_json(path: Path) -> dict:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
 def load_schema() -> dict:
     if not SCHEMA_PATH.exists():
         raise FileNotFoundError(f"Schema not found: {SCHEMA_PATH}")
-    return json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+    return read_json(SCHEMA_PATH)
 
 
 def load_map(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return read_json(path)
 
 
-def assert_no_surrogates(codepoint: int, path: Path, context: str) -> None:
-    if SURROGATE_MIN <= codepoint <= SURROGATE_MAX:
-        raise ValueError(f"{path}: surrogate codepoint in {context}: {hex(codepoint)}")
+@lru_cache(maxsize=None)
+def list_dir(directory: str) -> frozenset[str]:
+    # One scandir per directory replaces a stat per variant.
+    try:
+        with os.scandir(directory or ".") as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
 
 
-def get_ttf_family(path: Path) -> set[str]:
-    font = TTFont(path)
-    families = set()
-    for record in font["name"].names:
-        if record.nameID == 1:
-            try:
-                families.add(record.toUnicode())
-            except Exception as exc:  # pragma: no cover
-                raise ValueError(f"Unable to decode family name in {path}: {exc}") from exc
-    return families
+def get_ttf_family(path: Path) -> frozenset[str]:
+    # Variants sharing a TTF reuse one parse; mtime/size invalidate the entry.
+    stat = path.stat()
+    return _read_ttf_family(str(path), stat.st_mtime_ns, stat.st_size)
 
 
-def load_features() -> set[str]:
+@lru_cache(maxsize=256)
+def _read_ttf_family(path: str, mtime_ns: int, size: int) -> frozenset[str]:
+    families = set()
+    # lazy=True: only the name table is decompiled; `with` closes the file.
+    with TTFont(path, lazy=True) as font:
+        for record in font["name"].names:
+            if record.nameID == 1:
+                try:
+                    families.add(record.toUnicode())
+                except Exception as exc:  # pragma: no cover
+                    raise ValueError(f"Unable to decode family name in {path}: {exc}") from exc
+    return frozenset(families)
+
+
+@lru_cache(maxsize=None)
+def load_features() -> frozenset[str]:
     if not CARGO_TOML.exists():
         raise FileNotFoundError(f"Cargo.toml not found: {CARGO_TOML}")
-    try:
-        import tomllib
-        data = tomllib.loads(CARGO_TOML.read_text(encoding="utf-8"))
-    except ImportError:
-        try:
-            import tomli
-        except ImportError as exc:  # pragma: no cover
-            raise SystemExit(
-                "Missing tomllib/tomli. Install tomli or use Python 3.11+."
-            ) from exc
-        data = tomli.loads(CARGO_TOML.read_text(encoding="utf-8"))
+    if tomllib is None:  # pragma: no cover
+        raise SystemExit("Missing tomllib/tomli. Install tomli or use Python 3.11+.")
+    data = tomllib.loads(CARGO_TOML.read_text(encoding="utf-8"))
     features = data.get("features", {})
     if not isinstance(features, dict):
         raise ValueError("Invalid Cargo.toml: [features] must be a table")
-    return set(features.keys())
+    return frozenset(features.keys())
 
 
-def validate_map(path: Path, schema: dict, features: set[str]) -> None:
-    data = load_map(path)
-    jsonschema.Draft202012Validator(schema).validate(data)
+def build_validator(schema: dict) -> Callable[[dict], object]:
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    if jsonschema_rs is not None:
+        return jsonschema_rs.validator_for(schema).validate
+    if fastjsonschema is not None:
+        # use_default=False: validation must not fill defaults into the map.
+        return fastjsonschema.compile(schema, use_default=False)
+    return cls(schema).validate
+
 
+def validate_map(path: Path, data: dict, features: frozenset[str]) -> None:
+    """Checks beyond the schema; `data` must already have passed schema validation."""
     variant_ids = [v["id"] for v in data["variants"]]
-    if len(variant_ids) != len(set(variant_ids)):
+    variant_id_set = set(variant_ids)
+    if len(variant_ids) != len(variant_id_set):
         raise ValueError(f"{path}: duplicate variant.id values")
 
     icon_names = [i["name"] for i in data["icons"]]
     if len(icon_names) != len(set(icon_names)):
         raise ValueError(f"{path}: duplicate icon.name values")
 
-    variant_id_set = set(variant_ids)
-
     for variant in data["variants"]:
         feature = variant.get("feature")
         if feature is not None:
@@ -90,7 +139,7 @@ def validate_map(path: Path, schema: dict, features: set[str]) -> None:
                 raise ValueError(f"{path}: variant.feature '{feature}' not found in Cargo.toml")
 
         ttf_path = Path(variant["ttf_asset_path"])
-        if not ttf_path.exists():
+        if ttf_path.name not in list_dir(os.path.dirname(ttf_path)):
             raise FileNotFoundError(f"{path}: missing TTF at {ttf_path}")
 
         families = get_ttf_family(ttf_path)
@@ -101,34 +150,76 @@ def validate_map(path: Path, schema: dict, features: set[str]) -> None:
 
     for icon in data["icons"]:
         name = icon["name"]
-        if "codepoint" in icon:
-            assert_no_surrogates(icon["codepoint"], path, f"icon '{name}'")
+        # The surrogate check is inlined: it runs for every icon and override,
+        # and the error context is only formatted when it fails.
+        codepoint = icon.get("codepoint")
+        if codepoint is not None and SURROGATE_MIN <= codepoint <= SURROGATE_MAX:
+            raise ValueError(f"{path}: surrogate codepoint in icon '{name}': {hex(codepoint)}")
 
         overrides = icon.get("overrides", {})
         if overrides:
-            unknown = set(overrides.keys()) - variant_id_set
-            if unknown:
+            # issuperset() checks without allocating; the difference is only
+            # built for the error message.
+            if not variant_id_set.issuperset(overrides):
+                unknown = overrides.keys() - variant_id_set
                 raise ValueError(f"{path}: icon '{name}' overrides unknown variants: {sorted(unknown)}")
 
             for variant_id, cp in overrides.items():
-                assert_no_surrogates(cp, path, f"icon '{name}' override '{variant_id}'")
+                if SURROGATE_MIN <= cp <= SURROGATE_MAX:
+                    raise ValueError(
+                        f"{path}: surrogate codepoint in icon '{name}' override '{variant_id}': {hex(cp)}"
+                    )
 
         availability = icon.get("availability")
         if availability is not None:
-            unknown = set(availability) - variant_id_set
-            if unknown:
+            if not variant_id_set.issuperset(availability):
+                unknown = set(availability) - variant_id_set
                 raise ValueError(f"{path}: icon '{name}' availability unknown variants: {sorted(unknown)}")
 
             if overrides:
-                missing = set(overrides.keys()) - set(availability)
-                if missing:
+                availability_set = set(availability)
+                if not availability_set.issuperset(overrides):
+                    missing = overrides.keys() - availability_set
                     raise ValueError(
                         f"{path}: icon '{name}' overrides not listed in availability: {sorted(missing)}"
                     )
 
 
+_worker_validate: Callable[[dict], object] | None = None
+
+
+def _init_worker(schema: dict) -> None:
+    global _worker_validate
+    # Compiled validators cannot be pickled, so each worker builds its own.
+    _worker_validate = build_validator(schema)
+
+
+def _validate_worker(path: Path) -> None:
+    data = load_map(path)
+    try:
+        _worker_validate(data)
+    except Exception as exc:
+        # jsonschema / jsonschema-rs errors do not survive pickling back to
+        # the parent process, so they travel as plain ValueErrors.
+        raise ValueError(f"{path}: {exc}") from None
+    validate_map(path, data, load_features())
+
+
 def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate icon maps against the schema and TTF assets.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to CPU count)",
+    )
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
     schema = load_schema()
+    validate = build_validator(schema)
     features = load_features()
 
     if not MAPS_DIR.exists():
@@ -138,8 +229,20 @@ def main(argv: list[str] | None = None) -> int:
     if not map_files:
         raise FileNotFoundError(f"No map files found in {MAPS_DIR}")
 
-    for path in map_files:
-        validate_map(path, schema, features)
+    # Either way results are consumed in file order, so the first failing map
+    # (in sorted order) is the one reported.
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs == 1 or len(map_files) == 1:
+        # Maps are read ahead on worker threads while earlier ones are validated.
+        with ThreadPoolExecutor() as executor:
+            for path, data in zip(map_files, executor.map(load_map, map_files)):
+                validate(data)
+                validate_map(path, data, features)
+    else:
+        # Maps are independent; schema and fontTools work runs in parallel.
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(schema,)) as executor:
+            for _ in executor.map(_validate_worker, map_files):
+                pass
 
     return 0
 
@@ -1,50 +1,130 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
 import hashlib
 import json
+import mmap
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 MANIFEST_PATH = Path("ASSETS_MANIFEST.json")
 ASSETS_ROOT = Path("assets")
+HASH_CACHE_PATH = Path(".cache/asset_hashes.json")
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
     with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+        try:
+            # The mapping is hashed in one C call, straight from the page cache.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest()
+        except ValueError:
+            # Empty files cannot be mapped.
+            return hashlib.sha256().hexdigest()
+
+
+def load_hash_cache() -> dict[str, list]:
+    """Digests from the previous run: rel path -> [mtime_ns, size, sha256]."""
+    try:
+        data = json.loads(HASH_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_hash_cache(entries: dict[str, list]) -> None:
+    HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = HASH_CACHE_PATH.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(entries, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, HASH_CACHE_PATH)
+
+
+def hash_assets(assets: dict[str, Path], use_cache: bool) -> dict[str, str]:
+    """Hash every asset, reusing cached digests of files whose stat is unchanged."""
+    cache = load_hash_cache() if use_cache else {}
+    entries: dict[str, list] = {}
+    stale: list[str] = []
+    for rel_path, asset_path in assets.items():
+        stat = asset_path.stat()
+        key = [stat.st_mtime_ns, stat.st_size]
+        cached = cache.get(rel_path)
+        if isinstance(cached, list) and len(cached) == 3 and cached[:2] == key:
+            entries[rel_path] = cached
+        else:
+            entries[rel_path] = key
+            stale.append(rel_path)
+
+    # hashlib releases the GIL while hashing, so threads hash files in parallel.
+    if stale:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            digests = executor.map(sha256_file, (assets[rel_path] for rel_path in stale))
+            for rel_path, digest in zip(stale, digests):
+                entries[rel_path] = entries[rel_path] + [digest]
+
+    if entries != cache:
+        save_hash_cache(entries)
+    return {rel_path: entry[2] for rel_path, entry in entries.items()}
 
 
 def load_manifest() -> dict[str, str]:
     if not MANIFEST_PATH.exists():
         raise FileNotFoundError(f"Manifest not found: {MANIFEST_PATH}")
-    data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    if orjson is not None:
+        data = orjson.loads(MANIFEST_PATH.read_bytes())
+    else:
+        data = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError("Manifest must be a JSON object mapping paths to sha256 strings")
-    normalized: dict[str, str] = {}
-    for key, value in data.items():
-        if not isinstance(key, str) or not isinstance(value, str):
-            raise ValueError("Manifest keys and values must be strings")
-        normalized[key] = value
-    return normalized
+    # JSON object keys are always strings, so only the values need checking;
+    # the parsed dict is returned as is.
+    if not all(type(value) is str for value in data.values()):
+        raise ValueError("Manifest keys and values must be strings")
+    return data
+
+
+def walk_ttf(root: Path) -> Iterator[os.DirEntry]:
+    # DirEntry carries the file type from the directory listing, so the walk
+    # needs no per-entry stat.
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".ttf"):
+                    yield entry
 
 
 def collect_assets(repo_root: Path) -> dict[str, Path]:
     if not ASSETS_ROOT.exists():
         raise FileNotFoundError(f"Assets directory not found: {ASSETS_ROOT}")
-    assets: dict[str, Path] = {}
-    for path in sorted(ASSETS_ROOT.rglob("*.ttf")):
-        resolved = path.resolve()
-        rel = resolved.relative_to(repo_root).as_posix()
-        assets[rel] = resolved
-    return assets
-
+    found: dict[str, Path] = {}
+    for entry in walk_ttf(ASSETS_ROOT):
+        rel = os.path.relpath(entry.path, repo_root).replace(os.sep, "/")
+        found[rel] = Path(entry.path)
+    # Same order as the sorted Path listing: component-wise.
+    return {rel: found[rel] for rel in sorted(found, key=lambda rel: rel.split("/"))}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Verify asset SHA256 hashes against ASSETS_MANIFEST.json.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Rehash every asset instead of reusing digests from {HASH_CACHE_PATH.as_posix()}",
+    )
+    args = parser.parse_args(argv)
 
-def main() -> int:
     repo_root = Path.cwd().resolve()
     manifest = load_manifest()
     assets = collect_assets(repo_root)
@@ -66,14 +146,17 @@ def main() -> int:
             print(f"  {path}", file=sys.stderr)
         return 1
 
-    mismatched = []
-    for rel_path, asset_path in assets.items():
-        actual = sha256_file(asset_path)
-        expected = manifest[rel_path]
-        if actual != expected:
-            mismatched.append((rel_path, expected, actual))
+    digests = hash_assets(assets, use_cache=not args.no_cache)
+
+    # Both sides have the same keys by now, so a single dict comparison
+    # settles the common all-match case.
+    if digests != manifest:
+        mismatched = [
+            (rel_path, manifest[rel_path], actual)
+            for rel_path, actual in digests.items()
+            if actual != manifest[rel_path]
+        ]
 
-    if mismatched:
         print("Asset hash mismatches detected:", file=sys.stderr)
         for rel_path, expected, actual in mismatched:
             print(f"  {rel_path}", file=sys.stderr)
@@ -29,7 +29,9 @@ def convert_woff_to_ttf(src: Path, dst: Path) -> None:
         raise ValueError(f"Ожидался .woff или .woff2, получено: {src.suffix}")
 
     print(f"Читаю:  {src}")
-    font = TTFont(str(src))
+    # lazy=True: таблицы не декомпилируются и при сохранении пишутся как есть;
+    # пересчёт bbox и времени изменения тоже не нужен — меняется только обёртка.
+    font = TTFont(str(src), lazy=True, recalcBBoxes=False, recalcTimestamp=False)
     print(f"Пишу:   {dst}")
     font.flavor = None  # сбросить WOFF/WOFF2-обёртку
     font.save(str(dst))